@@ -402,6 +402,28 @@ def run_job_search(job_searcher):
         logger.warning("No jobs found")
         return []
 
+def filter_eligible_jobs(automator, jobs, error_notifier):
+    """
+    Select the jobs that meet the application requirements
+    
+    Args:
+        automator (JobApplicationAutomator): Job application automator
+        jobs (list): Job objects to check
+        error_notifier (ErrorNotifier): Notifier for per-job errors
+        
+    Returns:
+        list: Jobs that meet the requirements
+    """
+    eligible_jobs = []
+    for job in jobs:
+        try:
+            if automator.job_meets_requirements(job):
+                eligible_jobs.append(job)
+        except Exception as e:
+            logger.error(f"Error preparing application for {job.get('job_title')} at {job.get('employer_name')}: {str(e)}")
+            error_notifier.notify(f"Error preparing application: {str(e)}")
+    return eligible_jobs
+
 def send_email_notification(jobs, config):
     """
     Send email notification about new job listings
@@ -574,16 +596,13 @@ def main():
                 # Search for jobs
                 jobs = run_job_search(job_searcher)
                 
-                # Prepare job applications
-                for job in jobs:
-                    try:
-                        # Check if job meets requirements and prepare application package
-                        if automator.job_meets_requirements(job):
-                            automator.prepare_application_package(job)
-                            logger.info(f"Prepared application package for {job.get('employer_name')} - {job.get('job_title')}")
-                    except Exception as e:
-                        logger.error(f"Error preparing application for {job.get('job_title')} at {job.get('employer_name')}: {str(e)}")
-                        error_notifier.notify(f"Error preparing application: {str(e)}")
+                # Prepare job applications for jobs that meet requirements
+                try:
+                    eligible_jobs = filter_eligible_jobs(automator, jobs, error_notifier)
+                    automator.prepare_application_packages(eligible_jobs)
+                except Exception as e:
+                    logger.error(f"Error preparing applications: {str(e)}")
+                    error_notifier.notify(f"Error preparing application: {str(e)}")
             else:
                 logger.error("System health check failed, skipping job search")
                 error_notifier.notify("System health check failed")
@@ -616,15 +635,13 @@ def main():
                 if not args.apply_only and system_health_checker.check_system_health():
                     jobs = run_job_search(job_searcher)
                     
-                    # Prepare job applications
-                    for job in jobs:
-                        try:
-                            if automator.job_meets_requirements(job):
-                                automator.prepare_application_package(job)
-                                logger.info(f"Prepared application package for {job.get('employer_name')} - {job.get('job_title')}")
-                        except Exception as e:
-                            logger.error(f"Error preparing application: {str(e)}")
-                            error_notifier.notify(f"Error preparing application: {str(e)}")
+                    # Prepare job applications for jobs that meet requirements
+                    try:
+                        eligible_jobs = filter_eligible_jobs(automator, jobs, error_notifier)
+                        automator.prepare_application_packages(eligible_jobs)
+                    except Exception as e:
+                        logger.error(f"Error preparing application: {str(e)}")
+                        error_notifier.notify(f"Error preparing application: {str(e)}")
                 
                 # Process applications
                 if not args.search_only:
@@ -4,12 +4,19 @@ import json
 import logging
 import time
 import random
-import shutil
+import functools
+import itertools
+import threading
+import atexit
+import base64
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional
 from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-from bright_data_scraper import BrightDataScraper
 import re
-import uuid
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -25,25 +32,627 @@ from selenium.webdriver.support.ui import Select
 from smart_field_detector import SmartFieldDetector
 from mock_user_profile import get_mock_user_profile
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that buffers log writes and only flushes on warnings and errors
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536, encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('job_applications.log')
+        BufferedFileHandler('job_applications.log', delay=True)
     ]
 )
 logger = logging.getLogger("job_application_automator")
 
+# Patterns used to turn company names and job titles into directory names
+_FILENAME_INVALID_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SPACES_RE = re.compile(r'[\s]+')
+_FILENAME_DASHES_RE = re.compile(r'[-]+')
+
+
+# Most recent history entries kept in memory for get_recent_applications
+RECENT_HISTORY_LIMIT = 1000
+
+# Job sites with a dedicated application flow
+_SITE_RE = re.compile(r'(linkedin|indeed|glassdoor)\.com', re.IGNORECASE)
+
+# Dropdown kinds, recognized by the select's name
+_EDUCATION_SELECT_RE = re.compile(r'education|degree', re.IGNORECASE)
+_EXPERIENCE_SELECT_RE = re.compile(r'experience|years', re.IGNORECASE)
+_STATE_SELECT_RE = re.compile(r'state|province', re.IGNORECASE)
+
+# Common CAPTCHA identifiers, combined into one selector group so detection
+# costs a single WebDriver command
+CAPTCHA_SELECTOR = ", ".join([
+    "iframe[src*='recaptcha']",
+    "iframe[src*='captcha']",
+    "div.g-recaptcha",
+    "div[class*='captcha']",
+    "input[name*='captcha']"
+])
+
+# LinkedIn apply button candidates, most specific first
+LINKEDIN_APPLY_SELECTORS = (
+    ".jobs-apply-button",
+    "button[aria-label='Easy Apply']",
+    "button[aria-label='Apply']",
+    "button[data-control-name='jobdetails_apply_button']"
+)
+
+# LinkedIn Easy Apply navigation candidates, matched in a single query
+LINKEDIN_NEXT_SELECTOR = ", ".join([
+    "button[aria-label='Continue to next step']",
+    "button[aria-label='Next']",
+    "button[data-control-name='continue_unify']"
+])
+# The job page's own Easy Apply button stays on the page behind the modal,
+# so button.jobs-apply-button can't count as a submit button
+LINKEDIN_SUBMIT_SELECTORS = (
+    "button[aria-label='Submit application']",
+    "button[aria-label='Submit']",
+    "button[data-control-name='submit_unify']"
+)
+
+# Indeed apply and navigation candidates, matched in a single query
+INDEED_APPLY_SELECTOR = ", ".join([
+    ".jobsearch-IndeedApplyButton",
+    "button[id*='indeed-apply-button']",
+    "button[aria-label='Apply now']",
+    "button.indeed-apply-button",
+    "a[data-testid='apply-button-link']",
+    "div.ia-IndeedApplyButton"
+])
+INDEED_CONTINUE_SELECTOR = ", ".join([
+    ".ia-continueButton",
+    "button[data-testid='ia-continue-button']",
+    "button.icl-Button--primary",
+    "button.ia-ContinueButton"
+])
+INDEED_SUBMIT_SELECTOR = ", ".join([
+    ".ia-SubmitButton",
+    "button[data-testid='ia-submit-button']",
+    "button.ia-SubmitApplication"
+])
+# Continue and submit never show together, so one wait covers both
+INDEED_NAVIGATION_SELECTOR = f"{INDEED_CONTINUE_SELECTOR}, {INDEED_SUBMIT_SELECTOR}"
+
+# Glassdoor apply and navigation candidates, most specific first; loose
+# selectors like button[type='submit'] also match unrelated page forms
+GLASSDOOR_APPLY_SELECTORS = (
+    ".applyButton",
+    "button[data-test='apply-button']",
+    "a.gd-ui-button[data-test='apply-button']",
+    "a[href*='glassdoor.com/partner/jobListing.htm']"
+)
+GLASSDOOR_CONTINUE_SELECTORS = (
+    "button[data-test='continue-button']",
+    "button.e1ulk49s0",
+    "button.continueButton"
+)
+GLASSDOOR_SUBMIT_SELECTORS = (
+    "button[data-test='submit-button']",
+    "button[type='submit']",
+    "button.submit"
+)
+
+# Submit candidates on unknown sites, most specific first
+GENERIC_SUBMIT_SELECTORS = (
+    "button[type='submit']",
+    "input[type='submit']",
+    "button[id*='submit' i]",
+    "button[class*='submit' i]",
+    "button[id*='apply' i]",
+    "button[class*='apply' i]",
+    "a[id*='apply' i]",
+    "a[class*='apply' i]"
+)
+
+# Optional upload fields and frames, tried in order
+LINKEDIN_RESUME_SELECTORS = (
+    "input[type='file'][name='resume']",
+)
+LINKEDIN_COVER_LETTER_SELECTORS = (
+    "input[type='file'][name='cover-letter']",
+    "input[type='file'][name='coverLetter']",
+    "input[type='file'][data-test-form-element-file-upload-input='']"
+)
+INDEED_IFRAME_SELECTORS = (
+    "iframe#indeedapply-iframe",
+    "iframe[id*='indeed-apply']",
+    "iframe.indeed-apply-iframe"
+)
+# Any Indeed frame; only trusted once the specific frames had their chance,
+# since other Indeed frames can be on the page before the apply frame
+INDEED_FALLBACK_IFRAME_SELECTOR = "iframe[src*='indeed.com']"
+INDEED_RESUME_SELECTORS = (
+    "input[type='file'][name='resume']",
+    "input[type='file'][data-testid='resume-upload-input']",
+    "input[type='file'][data-testid='resume-upload']",
+    "input[type='file'][accept='.pdf,.doc,.docx']"
+)
+INDEED_COVER_LETTER_SELECTORS = (
+    "input[type='file'][name*='cover']",
+    "input[type='file'][accept*='.pdf']:not([name='resume'])",
+    "input[type='file'][data-testid='cover-letter-upload-input']"
+)
+GLASSDOOR_RESUME_SELECTORS = (
+    "input[type='file'][name='resume']",
+    "input[type='file'][name='resumeFile']",
+    "input[type='file'][accept='.doc,.docx,.pdf']",
+    "input[type='file'][data-test='resume-upload-input']"
+)
+GLASSDOOR_COVER_LETTER_SELECTORS = (
+    "input[type='file'][name='coverLetter']",
+    "input[type='file'][name='coverLetterFile']",
+    "input[type='file'][accept='.doc,.docx,.pdf,.txt']:not([name='resume'])",
+    "input[type='file'][data-test='coverletter-upload-input']"
+)
+GENERIC_RESUME_SELECTORS = (
+    "input[type='file'][name*='resume' i]",
+    "input[type='file'][id*='resume' i]",
+    "input[type='file'][name*='cv' i]",
+    "input[type='file'][id*='cv' i]",
+    "input[type='file'][name*='file' i]",
+    "input[type='file']"  # Generic fallback
+)
+GENERIC_COVER_LETTER_SELECTORS = (
+    "input[type='file'][name*='cover' i]",
+    "input[type='file'][id*='cover' i]",
+    "input[type='file'][name*='letter' i]",
+    "input[type='file'][id*='letter' i]"
+)
+
+# Ad and analytics hosts blocked in fast mode; application forms work without
+# them and they add dozens of requests to every page load
+BLOCKED_URL_PATTERNS = [
+    "*doubleclick*",
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*facebook.net*",
+    "*hotjar*",
+    "*segment.io*"
+]
+
+# Records the time of the latest DOM mutation in window.__lastMut, installing
+# the observer once per document
+_OBSERVE_MUTATIONS_JS = """
+if (window.__lastMut === undefined) {
+    window.__lastMut = performance.now();
+    new MutationObserver(() => { window.__lastMut = performance.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true});
+}
+"""
+
+# Marks the moment just before a navigation click
+STEP_MARKER_JS = _OBSERVE_MUTATIONS_JS + """
+window.__stepMarker = performance.now();
+"""
+
+# True once the DOM has changed since the step marker (or the document was
+# replaced), the page has loaded, and the DOM has then gone arguments[0]
+# milliseconds without a mutation
+DOM_SETTLED_JS = _OBSERVE_MUTATIONS_JS + """
+const changed = window.__stepMarker === undefined || window.__lastMut > window.__stepMarker;
+return changed && document.readyState === 'complete' && performance.now() - window.__lastMut > arguments[0];
+"""
+
+# Returns the first Indeed application iframe matching the selectors in
+# arguments[0], 'inline' if the form is on the page itself, or null
+INDEED_APPLY_FRAME_JS = """
+for (const selector of arguments[0]) {
+    const frame = document.querySelector(selector);
+    if (frame) return frame;
+}
+return document.querySelector('.ia-Resume-label, .ia-ContactInfo-label') ? 'inline' : null;
+"""
+
+# Classifies an Indeed navigation button as 'submit', 'review' or 'continue'
+# from the submit selector in arguments[1] and the button text
+INDEED_BUTTON_KIND_JS = """
+const button = arguments[0];
+if (button.matches(arguments[1]) || button.textContent.includes('Submit')) return 'submit';
+if (button.textContent.includes('Review')) return 'review';
+return 'continue';
+"""
+
+# Finds the first file input matching the selectors in arguments[0], in
+# order, and makes it displayed; returns [input, selector] or null
+REVEAL_FILE_INPUT_JS = """
+for (const selector of arguments[0]) {
+    const field = document.querySelector(selector);
+    if (field) {
+        field.style.display = 'block';
+        field.style.visibility = 'visible';
+        field.removeAttribute('hidden');
+        return [field, selector];
+    }
+}
+return null;
+"""
+
+# Lists the visible, enabled selects on the page with their name, current
+# value and [value, text] option pairs
+VISIBLE_SELECTS_JS = """
+return [...document.querySelectorAll('select')]
+    .filter(s => s.offsetParent !== null && !s.disabled && getComputedStyle(s).visibility !== 'hidden')
+    .map(s => ({element: s, name: s.name, value: s.value, options: [...s.options].map(o => [o.value, o.text])}));
+"""
+
+# Maps every label[for] target id to its lower-cased label text
+LABEL_FOR_MAP_JS = """
+return Object.fromEntries([...document.querySelectorAll('label[for]')].map(
+    l => [l.getAttribute('for'), l.textContent.trim().toLowerCase()]
+));
+"""
+
+# Returns [element, selector] for the first visible, enabled element matching
+# the selectors in arguments[0], in priority order, or null
+FIRST_CLICKABLE_JS = """
+for (const selector of arguments[0]) {
+    for (const el of document.querySelectorAll(selector)) {
+        if (el.offsetParent !== null && !el.disabled) {
+            return [el, selector];
+        }
+    }
+}
+return null;
+"""
+
+# Polls in the browser for the first visible, enabled element matching
+# arguments[0] until arguments[1] milliseconds have passed
+WAIT_FOR_SELECTOR_JS = """
+const done = arguments[arguments.length - 1];
+const selector = arguments[0];
+const deadline = Date.now() + arguments[1];
+(function poll() {
+    for (const el of document.querySelectorAll(selector)) {
+        if (el.offsetParent !== null && !el.disabled) {
+            done(el);
+            return;
+        }
+    }
+    if (Date.now() > deadline) {
+        done(null);
+        return;
+    }
+    setTimeout(poll, 50);
+})();
+"""
+
+# For each radio group matching arguments[0], returns the question label
+# text and the radio to select: the first one labelled "yes", otherwise the
+# first one in the group
+RADIO_CHOICES_JS = """
+const choices = [];
+for (const group of document.querySelectorAll(arguments[0])) {
+    const radios = Array.from(group.querySelectorAll("input[type='radio']"));
+    if (!radios.length) {
+        continue;
+    }
+    let label = group.previousElementSibling;
+    while (label && label.tagName !== 'LABEL') {
+        label = label.previousElementSibling;
+    }
+    const yes = radios.find(r => Array.from(r.labels || []).some(l => /yes/i.test(l.innerText)));
+    choices.push({question: label ? label.innerText : '', radio: yes || radios[0], yes: !!yes});
+}
+return choices;
+"""
+
+# Answers every radio fieldset on the page in place and returns what was
+# chosen. Work authorization gets "yes", sponsorship and relocation follow
+# arguments[0] (needSponsorship, willingToRelocate), other two-option groups
+# get "yes", and anything unresolved gets its first option
+INDEED_RADIO_ANSWERS_JS = """
+const prefs = arguments[0];
+const answers = [];
+for (const group of document.querySelectorAll('fieldset')) {
+    const radios = Array.from(group.querySelectorAll("input[type='radio']"));
+    const sibling = group.previousElementSibling;
+    const legend = group.querySelector('legend');
+    const question = ((sibling && sibling.innerText) || (legend && legend.innerText) || '').toLowerCase();
+    if (!question || !radios.length) {
+        continue;
+    }
+    const labelled = word => radios.find(r => Array.from(r.labels || []).some(l => l.innerText.toLowerCase().includes(word)));
+    let kind = 'question';
+    let word = null;
+    if (question.includes('authorized') || (question.includes('legally') && question.includes('work'))) {
+        kind = 'work authorization';
+        word = 'yes';
+    } else if (question.includes('sponsor')) {
+        kind = 'sponsorship';
+        word = prefs.needSponsorship ? 'yes' : 'no';
+    } else if (question.includes('relocat')) {
+        kind = 'relocation';
+        word = prefs.willingToRelocate ? 'yes' : 'no';
+    } else if (radios.length === 2) {
+        word = 'yes';
+    }
+    const choice = word ? labelled(word) : null;
+    (choice || radios[0]).click();
+    answers.push({question: question, kind: kind, answer: choice ? word : null});
+}
+return answers;
+"""
+
+# Counts the user-facing form controls on the page
+FORM_CONTROLS_JS = """
+return document.querySelectorAll("input:not([type=hidden]), select, textarea, fieldset").length;
+"""
+
+# Counts the user-facing form controls inside the LinkedIn Easy Apply modal,
+# leaving out the site header's search inputs
+LINKEDIN_FORM_CONTROLS_JS = """
+return document.querySelectorAll(
+    ".jobs-easy-apply-content input:not([type=hidden]), .jobs-easy-apply-content select, " +
+    ".jobs-easy-apply-content textarea, .jobs-easy-apply-content fieldset"
+).length;
+"""
+
+# Returns the first visible, enabled button whose text contains any of the
+# strings in arguments[0], or false
+BUTTON_WITH_TEXT_JS = """
+const texts = arguments[0];
+for (const button of document.querySelectorAll('button')) {
+    if (button.offsetParent !== null && !button.disabled && texts.some(t => button.textContent.includes(t))) {
+        return button;
+    }
+}
+return false;
+"""
+
+# Returns the text of the first label associated with arguments[0]
+LABEL_TEXT_JS = """
+const labels = arguments[0].labels;
+return labels && labels.length ? labels[0].innerText : '';
+"""
+
+# Fills visible, enabled fields for each {selector: value} in arguments[0]
+# and returns the number of fields filled per selector
+BULK_FILL_JS = """
+const skipTypes = new Set(['checkbox', 'radio', 'file', 'submit', 'button', 'hidden', 'image', 'reset']);
+const filled = {};
+for (const [selector, value] of Object.entries(arguments[0])) {
+    let count = 0;
+    for (const el of document.querySelectorAll(selector)) {
+        try {
+            if (el.offsetParent === null || el.disabled || getComputedStyle(el).visibility === 'hidden') {
+                continue;
+            }
+            if (value === true) {
+                if (el.type === 'checkbox' && !el.checked) {
+                    el.click();
+                    count++;
+                }
+                continue;
+            }
+            if (skipTypes.has(el.type)) {
+                continue;
+            }
+            const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+            count++;
+        } catch (e) {
+            // One unfillable match must not stop the rest of the form
+        }
+    }
+    if (count) {
+        filled[selector] = count;
+    }
+}
+return filled;
+"""
+
+# Replaces the value of the field in arguments[0] with arguments[1] the same
+# way BULK_FILL_JS does, without a separate clear command
+SET_VALUE_JS = """
+const el = arguments[0];
+const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Number of processed applications between pending journal syncs
+PENDING_JOURNAL_SYNC_EVERY = 10
+
+# Formatted date strings, refreshed at most once per second
+_DATE_STR_CACHE = {}
+
+
+def _date_str(fmt):
+    """
+    Format the current local date, reusing the result within the same second
+    
+    Args:
+        fmt (str): strftime format
+        
+    Returns:
+        str: Formatted current date
+    """
+    second = int(time.time())
+    cached = _DATE_STR_CACHE.get(fmt)
+    if cached is None or cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second).strftime(fmt))
+        _DATE_STR_CACHE[fmt] = cached
+    return cached[1]
+
+
+def _json_dumps(obj, pretty=False):
+    """
+    Serialize an object to JSON bytes, using orjson when it is installed
+    
+    Args:
+        obj: JSON-serializable object
+        pretty (bool): Whether to indent the output
+        
+    Returns:
+        bytes: Encoded JSON terminated by a newline
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+    return (json.dumps(obj, separators=(',', ':')) + "\n").encode("utf-8")
+
+
+def _json_loads(data):
+    """
+    Parse JSON bytes or text, using orjson when it is installed
+    
+    Args:
+        data (bytes or str): Encoded JSON
+        
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
+class ApplicationRecord:
+    """
+    Summary of an application history entry kept in memory
+    """
+    job_id: Optional[str]
+    job_title: Optional[str]
+    company: Optional[str]
+    apply_link: Optional[str]
+    application_date: str
+    status: Optional[str]
+    
+    @classmethod
+    def from_dict(cls, app):
+        """
+        Build a record from an application history entry
+        
+        Args:
+            app (dict): Application history entry
+            
+        Returns:
+            ApplicationRecord: Record holding the summary fields
+        """
+        return cls(
+            job_id=app.get("job_id"),
+            job_title=app.get("job_title"),
+            company=app.get("company") or app.get("employer_name"),
+            apply_link=app.get("apply_link"),
+            application_date=app.get("application_date") or "",
+            status=app.get("status")
+        )
+    
+    def to_dict(self):
+        """
+        Convert the record back to an application history entry
+        
+        Returns:
+            dict: Application history entry
+        """
+        return asdict(self)
+
+
+class ButtonWithText:
+    """
+    Expected condition for a visible, enabled button whose text contains any
+    of the given strings, checked with one script call per poll
+    """
+    
+    def __init__(self, *texts):
+        """
+        Initialize the condition
+        
+        Args:
+            *texts (str): Case-sensitive text fragments to look for
+        """
+        self.texts = list(texts)
+    
+    def __call__(self, driver):
+        """
+        Find the first matching button
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            
+        Returns:
+            WebElement or False: First matching button, False if none yet
+        """
+        return driver.execute_script(BUTTON_WITH_TEXT_JS, self.texts)
+
 # Load environment variables
 load_dotenv()
 
+# Cover letter used when no template file is available
+DEFAULT_COVER_LETTER_TEMPLATE = """Dear Hiring Manager,
+
+I am writing to express my interest in the {job_title} position at {company_name}. With my experience in {skills}, I believe I would be a valuable addition to your team.
+
+{custom_paragraph}
+
+Thank you for considering my application. I look forward to the opportunity to discuss how my skills and experience align with your needs.
+
+Sincerely,
+{name}
+{email}
+{phone}
+"""
+
 class JobApplicationAutomator:
     """
     A class for automating job applications using Bright Data Web Unlocker API
     """
     
+    # ChromeDriver binary path, resolved by webdriver-manager once per process
+    _DRIVER_PATH = None
+    _DRIVER_PATH_LOCK = threading.Lock()
+    
+    # LinkedIn Easy Apply locators
+    _LI_CONTENT = (By.CSS_SELECTOR, ".jobs-easy-apply-content")
+    _LI_DROPDOWN = (By.CSS_SELECTOR, "[data-test-dropdown-trigger]")
+    _LI_DROPDOWN_OPTION = (By.CSS_SELECTOR, ".jobs-easy-apply-dropdown__option")
+    _LI_QUESTION = (By.CSS_SELECTOR, ".jobs-easy-apply-form-section__grouping")
+    _LI_QUESTION_LABEL = (By.CSS_SELECTOR, "label, legend")
+    _LI_RADIO_GROUP = (By.CSS_SELECTOR, "fieldset.fb-radio-buttons")
+    _RADIO = (By.CSS_SELECTOR, "input[type='radio']")
+    _TEXT_INPUT = (By.CSS_SELECTOR, "input[type='text']")
+    
+    # LinkedIn custom question kinds, checked in priority order: each
+    # alternative looks ahead through the whole question and the named
+    # group of the first one that matches identifies the kind
+    _QUESTION_RE = re.compile(
+        r"(?:(?=.*(?:salary|compensation|expected pay))(?P<salary>)"
+        r"|(?=.*(?:start date|start work|when can you start))(?P<start_date>)"
+        r"|(?=.*(?:authorized|work authorization|legally.*work|work.*legally))(?P<work_auth>))",
+        re.DOTALL
+    )
+    
     def __init__(self, config_path="config.json", debug=False, headless=True, use_incognito=True, test_mode=False):
         """
         Initialize the job application automator
@@ -57,8 +666,8 @@ class JobApplicationAutomator:
         """
         # Load configuration
         try:
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+            with open(config_path, 'rb') as f:
+                self.config = _json_loads(f.read())
         except Exception as e:
             logger.error(f"Error loading configuration: {str(e)}")
             self.config = {
@@ -101,10 +710,36 @@ class JobApplicationAutomator:
         self.max_daily_applications = int(self.config.get("max_daily_applications", "5"))
         self.application_delay = float(self.config.get("application_delay", "2.0"))
         
-        # Initialize pending applications list
-        self._pending_applications = []
+        # Lowercase job filters once so job_meets_requirements only lowercases the job
+        self._job_titles_lc = [title.lower() for title in self.config.get("job_titles", [])]
+        self._excluded_companies_lc = [company.lower() for company in self.config.get("excluded_companies", [])]
+        self._excluded_titles_lc = [term.lower() for term in self.config.get("excluded_titles", [])]
+        self._excluded_terms_lc = [term.lower() for term in self.config.get("excluded_terms", [])]
+        
+        # Load the cover letter template once; it is only formatted per application
+        template_path = os.path.join(os.path.dirname(__file__), "templates", "cover_letter_template.txt")
+        try:
+            with open(template_path, "r") as f:
+                self._cover_letter_template = f.read()
+        except OSError:
+            logger.warning(f"Cover letter template not found at {template_path}, using default template")
+            self._cover_letter_template = DEFAULT_COVER_LETTER_TEMPLATE
+        self._letter_contact = {
+            "name": self.config.get("name", "Your Name"),
+            "email": self.config.get("email", "your.email@example.com"),
+            "phone": self.config.get("phone", "123-456-7890")
+        }
+        
+        # Pending applications and history are loaded on first use
+        self._pending_applications = None
         self._application_history = None
         
+        # has_applied_to_job results by job_id for the current run
+        self._applied_cache = {}
+        
+        # Cover letter text by (path, mtime) for filling text areas
+        self._cover_letter_cache = {}
+        
         # Verify resume exists
         if not os.path.exists(self.resume_path):
             # Try relative path
@@ -115,8 +750,8 @@ class JobApplicationAutomator:
             else:
                 logger.warning(f"Resume not found at {self.resume_path} or {relative_path}")
         
-        # Initialize Bright Data scraper with test mode
-        self.bright_data = BrightDataScraper(test_mode=self.test_mode)
+        # Bright Data scraper is created on first use
+        self._bright_data = None
         
         # Create applications directory if it doesn't exist
         os.makedirs(self.application_path, exist_ok=True)
@@ -125,13 +760,32 @@ class JobApplicationAutomator:
         self.log_dir = os.path.join(self.application_path, "logs")
         os.makedirs(self.log_dir, exist_ok=True)
         
-        # Load application history
-        self.application_history_file = os.path.join(self.log_dir, "application_history.json")
-        self.application_history = self.load_application_history()
+        # Pending applications file, and the journal of status changes that is
+        # compacted into it once it grows past the threshold
+        self.pending_file_path = os.path.join(self.log_dir, "pending_applications.json")
+        self._pending_journal_file = os.path.join(self.log_dir, "pending_applications.jsonl")
+        self._pending_journal = None
+        self._pending_journal_entries = 0
+        self._pending_journal_lock = threading.Lock()
+        self.pending_journal_max_entries = int(os.getenv("PENDING_JOURNAL_MAX_ENTRIES", "500"))
+        
+        # Metadata of application directories, keyed by directory name and
+        # refreshed when metadata.json changes
+        self.pending_index_file = os.path.join(self.log_dir, "pending_index.json")
+        self._pending_index = None
+        
+        # Application history is parsed on first access of application_history;
+        # entries beyond history_max_active are moved to the archive
+        self.application_history_file = os.path.join(self.log_dir, "application_history.jsonl")
+        self.application_stats_file = os.path.join(self.log_dir, "stats.json")
+        self.application_history_archive_file = os.path.join(self.log_dir, "application_history.archive.jsonl")
+        self.history_max_active = int(os.getenv("HISTORY_MAX_ACTIVE", "10000"))
+        self._archive_indexed = False
         
         logger.info(f"JobApplicationAutomator initialized")
         
-        # Initialize Selenium WebDriver to None
+        # Selenium WebDrivers by thread, so each worker drives its own browser
+        self._drivers = {}
         self.driver = None
         
         # Maximum retries for failed actions
@@ -141,16 +795,107 @@ class JobApplicationAutomator:
         self.page_load_timeout = int(os.getenv("PAGE_LOAD_TIMEOUT", "60"))
         self.element_timeout = int(os.getenv("ELEMENT_TIMEOUT", "10"))
         
+        # Whether to show the browser and log full tracebacks for browser errors
+        self._debug_browser = os.getenv("DEBUG_BROWSER", "false").lower() == "true"
+        
+        # Answers to yes/no screening questions
+        self.need_sponsorship = os.getenv("NEED_SPONSORSHIP", "false").lower() == "true"
+        self.willing_to_relocate = os.getenv("WILLING_TO_RELOCATE", "true").lower() == "true"
+        
+        # Whether to keep a screenshot of every submitted application
+        self.capture_screenshots = os.getenv("CAPTURE_SCREENSHOTS", "false").lower() == "true"
+        
+        # Whether to keep cookies between applications so a site session
+        # established in the reused browser carries over to the next job
+        self.keep_browser_session = os.getenv("KEEP_BROWSER_SESSION", "false").lower() == "true"
+        
+        # Whether to block ad and tracker requests in the browser
+        self.fast_mode = os.getenv("FAST_MODE", "false").lower() == "true"
+        
+        # Seconds to wait per simulated submission in test mode
+        self.simulated_submission_delay = float(os.getenv("SIMULATED_SUBMISSION_DELAY", "0"))
+        
         # Application status tracking
         self.current_application = None
         
-        # Recovery points for resuming applications
+        # Site-specific application flows by site type
+        self._site_dispatch = {
+            "linkedin": self._apply_linkedin,
+            "indeed": self._apply_indeed,
+            "glassdoor": self._apply_glassdoor
+        }
+        
+        # Recovery points for resuming applications, flushed once per application
         self.recovery_points = {}
+        self._recovery_dirty = False
+        
+        # Guards history and recovery state shared between worker threads
+        self._state_lock = threading.RLock()
         
         # CAPTCHA handling
         self.captcha_detection_enabled = os.getenv("CAPTCHA_DETECTION_ENABLED", "true").lower() == "true"
         self.captcha_service = os.getenv("CAPTCHA_SERVICE", None)
         self.captcha_api_key = os.getenv("CAPTCHA_API_KEY", None)
+        
+        # Shared worker pool for submissions; each worker thread drives its
+        # own browser
+        self.apply_workers = int(os.getenv("APPLY_WORKERS", "1"))
+        self._executor = ThreadPoolExecutor(max_workers=self.apply_workers, thread_name_prefix="apply")
+        self._submission_lock = threading.Lock()
+        self._next_submission_at = 0.0
+        atexit.register(self.close)
+    
+    @functools.cached_property
+    def application_history(self):
+        """
+        Application history, loaded and indexed on first access
+        
+        Returns:
+            dict: Application history
+        """
+        return self.load_application_history()
+    
+    @property
+    def pending_applications(self):
+        """
+        Pending applications, loaded from file on first access
+        
+        Returns:
+            list: Pending applications
+        """
+        if self._pending_applications is None:
+            self._load_pending_applications()
+        return self._pending_applications
+    
+    @property
+    def driver(self):
+        """
+        Selenium WebDriver used by the current thread
+        
+        Returns:
+            WebDriver: The thread's browser, or None if it has not been started
+        """
+        return self._drivers.get(threading.get_ident())
+    
+    @driver.setter
+    def driver(self, value):
+        if value is None:
+            self._drivers.pop(threading.get_ident(), None)
+        else:
+            self._drivers[threading.get_ident()] = value
+    
+    @property
+    def bright_data(self):
+        """
+        Bright Data scraper, imported and created on first access
+        
+        Returns:
+            BrightDataScraper: Scraper configured with the automator's test mode
+        """
+        if self._bright_data is None:
+            from bright_data_scraper import BrightDataScraper
+            self._bright_data = BrightDataScraper(test_mode=self.test_mode)
+        return self._bright_data
     
     def _initialize_browser(self):
         """
@@ -159,21 +904,17 @@ class JobApplicationAutomator:
         Returns:
             WebDriver: Configured Selenium WebDriver
         """
+        # Reuse the thread's browser; a dead session is detected when it is
+        # next used rather than probed here
         if self.driver:
-            try:
-                # Check if browser is still responsive
-                self.driver.title
-                return self.driver
-            except:
-                # Browser crashed or is unresponsive, close it
-                self._close_browser()
+            return self.driver
         
         try:
             # Configure Chrome options
             chrome_options = Options()
             
             # Run headless unless in debug mode
-            if not os.getenv("DEBUG_BROWSER", "false").lower() == "true":
+            if not self._debug_browser:
                 chrome_options.add_argument("--headless")
                 
             # Add common Chrome options for stability
@@ -192,12 +933,19 @@ class JobApplicationAutomator:
                 "download.default_directory": self.application_path,
                 "download.prompt_for_download": False,
                 "download.directory_upgrade": True,
-                "safebrowsing.enabled": True
+                "safebrowsing.enabled": True,
+                # Application forms don't need images or notification prompts
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
             }
             chrome_options.add_experimental_option("prefs", chrome_prefs)
             
+            # Return from driver.get once the DOM is ready instead of waiting
+            # for every subresource to load
+            chrome_options.page_load_strategy = "eager"
+            
             # Initialize the browser
-            service = Service(ChromeDriverManager().install())
+            service = Service(self._chromedriver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Set timeouts
@@ -207,16 +955,55 @@ class JobApplicationAutomator:
             # Set window size
             driver.set_window_size(1920, 1080)
             
+            if self.fast_mode:
+                try:
+                    driver.execute_cdp_cmd("Network.enable", {})
+                    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+                except WebDriverException as e:
+                    logger.warning(f"Could not block tracker requests: {str(e)}")
+            
             self.driver = driver
             logger.info("Successfully initialized Chrome WebDriver")
             return driver
         
         except Exception as e:
             logger.error(f"Error initializing browser: {str(e)}")
-            if os.getenv("DEBUG_BROWSER", "false").lower() == "true":
+            if self._debug_browser:
                 logger.error(traceback.format_exc())
             return None
     
+    @classmethod
+    def _chromedriver_path(cls):
+        """
+        Get the ChromeDriver binary path, installing it on first use
+        
+        Returns:
+            str: Path to the ChromeDriver binary
+        """
+        with cls._DRIVER_PATH_LOCK:
+            if cls._DRIVER_PATH is None:
+                cls._DRIVER_PATH = ChromeDriverManager().install()
+            return cls._DRIVER_PATH
+    
+    def _reset_browser_session(self):
+        """
+        Clear the browser session between applications so the browser can be
+        reused instead of restarted
+        
+        Cookies are kept when keep_browser_session is set, so a logged-in
+        site session is reused by the next application.
+        """
+        if not self.driver:
+            return
+        
+        try:
+            if not self.keep_browser_session:
+                self.driver.delete_all_cookies()
+            self.driver.get("about:blank")
+        except WebDriverException as e:
+            logger.warning(f"Could not reset browser session, closing browser: {str(e)}")
+            self._close_browser()
+    
     def _close_browser(self):
         """
         Safely close the browser
@@ -224,11 +1011,32 @@ class JobApplicationAutomator:
         if self.driver:
             try:
                 self.driver.quit()
-            except:
+            except (WebDriverException, OSError):
                 pass
             self.driver = None
     
-    def _safe_click(self, element, retry_count=0, max_retries=3):
+    def _close_all_browsers(self):
+        """
+        Safely close the browsers of every thread
+        """
+        self._close_browsers(list(self._drivers))
+    
+    def _close_browsers(self, thread_ids):
+        """
+        Safely close the browsers started by the given threads
+        
+        Args:
+            thread_ids (iterable): Identifiers of the threads whose browsers to close
+        """
+        for thread_id in thread_ids:
+            driver = self._drivers.pop(thread_id, None)
+            if driver:
+                try:
+                    driver.quit()
+                except (WebDriverException, OSError):
+                    pass
+    
+    def _safe_click(self, element, retry_count=0, max_retries=2):
         """
         Safely click an element with retry logic
         
@@ -252,28 +1060,225 @@ class JobApplicationAutomator:
             logger.warning(f"Click failed with {str(e)}, trying alternative methods")
             
             try:
-                # Try to scroll the element into view
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.5)
-                
-                try:
-                    # Try clicking again after scrolling
-                    element.click()
-                    return True
-                except:
-                    # Try JavaScript click
-                    self.driver.execute_script("arguments[0].click();", element)
-                    return True
+                # Scroll the element into view and click it in one WebDriver command
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element)
+                return True
             except Exception as e2:
                 logger.warning(f"Alternative click methods failed: {str(e2)}")
                 
-                # Wait a moment and retry
-                time.sleep(1)
+                # Wait until the element is displayed again and retry
+                try:
+                    WebDriverWait(self.driver, 1).until(lambda d: element.is_displayed())
+                except (TimeoutException, StaleElementReferenceException):
+                    pass
                 return self._safe_click(element, retry_count + 1, max_retries)
         except Exception as e:
             logger.error(f"Unexpected error when clicking: {str(e)}")
             return False
     
+    def _wait(self, driver, timeout):
+        """
+        Create a WebDriverWait that polls every 100 ms for short waits
+        
+        The default 500 ms interval adds up to half a second to every wait for
+        elements that appear almost immediately; waits of 10 seconds or more
+        keep using WebDriverWait's default interval.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            timeout (float): Seconds to wait
+            
+        Returns:
+            WebDriverWait: Wait object
+        """
+        poll_frequency = 0.1 if timeout < 10 else 0.5
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency, ignored_exceptions=(NoSuchElementException,))
+    
+    def _first_clickable_in_order(self, driver, selectors, texts=(), timeout=3):
+        """
+        Find the first visible, enabled element for a list of selectors in
+        priority order, falling back to a button text match
+        
+        Every poll checks all candidates with one script call, but a match for
+        an earlier selector always wins over one that comes first in the page.
+        The text fallback is probed once, after the wait has run out.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            selectors (tuple): CSS selectors, best first
+            texts (tuple): Button text fragments to fall back to
+            timeout (float): Seconds to wait for any candidate
+            
+        Returns:
+            WebElement: Matching element, or None if nothing matched
+        """
+        try:
+            element, _ = self._wait(driver, timeout).until(
+                lambda d: d.execute_script(FIRST_CLICKABLE_JS, selectors)
+            )
+            return element
+        except TimeoutException:
+            pass
+        except WebDriverException as e:
+            logger.warning(f"Error waiting for {selectors[0]}: {str(e)}")
+        
+        if not texts:
+            return None
+        
+        try:
+            return ButtonWithText(*texts)(driver) or None
+        except WebDriverException as e:
+            logger.warning(f"Error looking for {texts} buttons: {str(e)}")
+            return None
+    
+    def _upload_file(self, driver, selectors, file_path, timeout):
+        """
+        Send a file to the first upload field found, in selector priority order
+        
+        Waits once for any of the candidates to be present rather than once
+        per candidate, then picks the highest-priority one on the page and
+        unhides it, since sites often cover the input with a styled button and
+        send_keys fails on inputs that aren't displayed.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            selectors (tuple): CSS selectors for the upload field, best first
+            file_path (str): Path of the file to upload
+            timeout (float): Seconds to wait for any candidate
+            
+        Returns:
+            str: Selector of the field used, or None if no field appeared
+        """
+        try:
+            self._wait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ", ".join(selectors)))
+            )
+        except TimeoutException:
+            return None
+        
+        found = driver.execute_script(REVEAL_FILE_INPUT_JS, selectors)
+        if not found:
+            return None
+        
+        field, selector = found
+        field.send_keys(file_path)
+        return selector
+    
+    def _wait_for_selector(self, driver, selector, timeout):
+        """
+        Wait in the browser for the first visible, enabled element matching a
+        selector, using a single WebDriver command
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            selector (str): CSS selector, may be a comma-separated group
+            timeout (float): Maximum time to wait in seconds
+            
+        Returns:
+            WebElement: Matching element, or None if none appeared in time
+        """
+        try:
+            return driver.execute_async_script(WAIT_FOR_SELECTOR_JS, selector, int(timeout * 1000))
+        except WebDriverException as e:
+            logger.warning(f"Error waiting for {selector}: {str(e)}")
+            return None
+    
+    def _first_clickable(self, driver, selector, texts=(), timeout=3):
+        """
+        Find the first visible, enabled element for a combined selector,
+        falling back to a button text match
+        
+        The text fallback covers buttons the CSS candidates cannot express
+        and is probed once, after the selector wait has run out.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            selector (str): Comma-joined CSS selector
+            texts (tuple): Button text fragments to fall back to
+            timeout (float): Seconds to wait for the selector
+            
+        Returns:
+            WebElement: Matching element, or None if nothing matched
+        """
+        element = self._wait_for_selector(driver, selector, timeout)
+        if element or not texts:
+            return element
+        
+        try:
+            return ButtonWithText(*texts)(driver) or None
+        except WebDriverException as e:
+            logger.warning(f"Error looking for {texts} buttons: {str(e)}")
+            return None
+    
+    def _bulk_fill(self, driver, mapping):
+        """
+        Fill form fields in a single WebDriver command
+        
+        Text values are assigned through the native value setter and announced
+        with input/change events so framework-managed inputs pick them up.
+        A value of True checks matching unchecked checkboxes. Empty values are
+        skipped, as are hidden and disabled fields and text values for inputs
+        such as checkboxes, radios and file uploads that a broad selector also
+        matched. A field that can't be filled doesn't stop the others.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            mapping (dict): Values (str or True) by CSS selector
+            
+        Returns:
+            dict: Number of fields filled by selector
+        """
+        mapping = {selector: value for selector, value in mapping.items() if value}
+        if not mapping:
+            return {}
+        
+        try:
+            filled = driver.execute_script(BULK_FILL_JS, mapping) or {}
+        except WebDriverException as e:
+            logger.warning(f"Error filling form fields: {str(e)}")
+            return {}
+        
+        for selector, count in filled.items():
+            logger.info(f"Filled {count} field(s) with selector: {selector}")
+        return filled
+    
+    def _set_value(self, driver, element, value):
+        """
+        Replace a text field's value in a single WebDriver command
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            element (WebElement): Input or textarea element
+            value (str): New value
+        """
+        driver.execute_script(SET_VALUE_JS, element, value)
+    
+    def _save_screenshot_async(self, driver, path):
+        """
+        Capture a screenshot and write it to disk on a background thread
+        
+        The image is captured before returning, so the browser can be reset or
+        closed immediately afterwards; decoding and writing happen off-thread.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            path (str): Destination file path
+        """
+        try:
+            encoded = driver.get_screenshot_as_base64()
+        except WebDriverException as e:
+            logger.warning(f"Could not capture screenshot {path}: {str(e)}")
+            return
+        
+        def write():
+            try:
+                with open(path, 'wb') as f:
+                    f.write(base64.b64decode(encoded))
+            except OSError as e:
+                logger.warning(f"Could not save screenshot {path}: {str(e)}")
+        
+        threading.Thread(target=write, name="screenshot-writer", daemon=True).start()
+    
     def _detect_and_handle_captcha(self, driver):
         """
         Detect and attempt to handle CAPTCHA challenges
@@ -288,34 +1293,20 @@ class JobApplicationAutomator:
             return False
             
         try:
-            # Common CAPTCHA identifiers
-            captcha_indicators = [
-                "iframe[src*='recaptcha']",
-                "iframe[src*='captcha']",
-                "div.g-recaptcha",
-                "div[class*='captcha']",
-                "input[name*='captcha']"
-            ]
-            
-            # Check for presence of CAPTCHA elements
-            for indicator in captcha_indicators:
-                try:
-                    captcha_element = driver.find_elements(By.CSS_SELECTOR, indicator)
-                    if captcha_element:
-                        logger.warning("CAPTCHA detected, attempting to handle")
-                        
-                        # Take screenshot for manual review
-                        screenshot_path = os.path.join(self.application_path, "captcha_screenshot.png")
-                        driver.save_screenshot(screenshot_path)
-                        
-                        # If we have a CAPTCHA service configured, try to solve it
-                        if self.captcha_service and self.captcha_api_key:
-                            return self._solve_captcha(driver, captcha_element)
-                        else:
-                            logger.error("CAPTCHA detected but no solver service configured")
-                            return False
-                except:
-                    continue
+            # Check for presence of CAPTCHA elements in a single query
+            captcha_element = driver.find_elements(By.CSS_SELECTOR, CAPTCHA_SELECTOR)
+            if captcha_element:
+                logger.warning("CAPTCHA detected, attempting to handle")
+                
+                # If we have a CAPTCHA service configured, keep a screenshot
+                # for review and try to solve it
+                if self.captcha_service and self.captcha_api_key:
+                    screenshot_path = os.path.join(self.application_path, "captcha_screenshot.png")
+                    self._save_screenshot_async(driver, screenshot_path)
+                    return self._solve_captcha(driver, captcha_element)
+                else:
+                    logger.error("CAPTCHA detected but no solver service configured")
+                    return False
                     
             # No CAPTCHA detected
             return False
@@ -352,21 +1343,35 @@ class JobApplicationAutomator:
             app_id = application.get('id') or application.get('job_id')
             if not app_id:
                 return
-                
-            self.recovery_points[app_id] = {
-                'state': state,
-                'timestamp': time.time(),
-                'url': self.driver.current_url if self.driver else None
-            }
             
-            # Save recovery points to disk
-            recovery_file = os.path.join(self.log_dir, "recovery_points.json")
-            with open(recovery_file, 'w') as f:
-                json.dump(self.recovery_points, f, indent=2)
+            url = self.driver.current_url if self.driver else None
+            
+            # Recovery points are written to disk by _flush_recovery
+            with self._state_lock:
+                self.recovery_points[app_id] = {
+                    'state': state,
+                    'timestamp': time.time(),
+                    'url': url
+                }
+                self._recovery_dirty = True
                 
         except Exception as e:
             logger.error(f"Error saving application state: {str(e)}")
     
+    def _flush_recovery(self):
+        """
+        Write recovery points to disk if they changed since the last flush
+        """
+        with self._state_lock:
+            if not self._recovery_dirty:
+                return
+            
+            try:
+                self._atomic_write_json(os.path.join(self.log_dir, "recovery_points.json"), self.recovery_points)
+                self._recovery_dirty = False
+            except Exception as e:
+                logger.error(f"Error saving recovery points: {str(e)}")
+    
     def _load_recovery_points(self):
         """
         Load saved recovery points for applications
@@ -376,10 +1381,10 @@ class JobApplicationAutomator:
         """
         try:
             recovery_file = os.path.join(self.log_dir, "recovery_points.json")
-            if os.path.exists(recovery_file):
-                with open(recovery_file, 'r') as f:
-                    self.recovery_points = json.load(f)
-                    return self.recovery_points
+            with open(recovery_file, 'rb') as f:
+                self.recovery_points = _json_loads(f.read())
+                return self.recovery_points
+        except FileNotFoundError:
             return {}
         except Exception as e:
             logger.error(f"Error loading recovery points: {str(e)}")
@@ -397,6 +1402,8 @@ class JobApplicationAutomator:
         Returns:
             bool: True if recorded successfully, False otherwise
         """
+        import uuid
+        
         try:
             # Get application details
             metadata = application.get('metadata', {})
@@ -404,14 +1411,15 @@ class JobApplicationAutomator:
             job_title = metadata.get('job_title', application.get('job_title', 'Unknown Position'))
             company = metadata.get('company', metadata.get('employer_name', application.get('employer_name', 'Unknown Company')))
             apply_link = metadata.get('apply_link', application.get('job_apply_link', '#'))
+            now = datetime.now()
             
             # Prepare application record
             application_record = {
-                'job_id': application.get('job_id', str(uuid.uuid4())),
+                'job_id': application.get('job_id') or str(uuid.uuid4()),
                 'job_title': job_title,
                 'company': company,
                 'apply_link': apply_link,
-                'application_date': datetime.now().isoformat(),
+                'application_date': now.isoformat(),
                 'status': status
             }
             
@@ -419,39 +1427,43 @@ class JobApplicationAutomator:
             if error:
                 application_record['error'] = error
             
-            # Add to application history
-            if not self.application_history:
-                self.application_history = self.load_application_history()
+            with self._state_lock:
+                # Update statistics
+                today = _date_str("%Y-%m-%d")
+                stats = self.application_history['stats']
                 
-            # Update statistics
-            today = datetime.now().strftime("%Y-%m-%d")
-            
-            if today not in self.application_history['stats']['by_date']:
-                self.application_history['stats']['by_date'][today] = {
-                    'count': 0,
-                    'submitted': 0,
-                    'failed': 0,
-                    'error': 0
-                }
+                day_stats = stats['by_date'].get(today)
+                if day_stats is None:
+                    day_stats = stats['by_date'][today] = {
+                        'count': 0,
+                        'submitted': 0,
+                        'failed': 0,
+                        'error': 0
+                    }
                 
-            self.application_history['stats']['total'] += 1
-            self.application_history['stats']['by_date'][today]['count'] += 1
-            
-            if status == 'submitted':
-                self.application_history['stats']['submitted'] += 1
-                self.application_history['stats']['by_date'][today]['submitted'] += 1
-            elif status == 'failed':
-                self.application_history['stats']['failed'] += 1
-                self.application_history['stats']['by_date'][today]['failed'] += 1
-            elif status == 'error':
-                self.application_history['stats']['errors'] += 1
-                self.application_history['stats']['by_date'][today]['error'] += 1
+                stats['total'] = stats.get('total', 0) + 1
+                day_stats['count'] += 1
                 
-            # Add to applications list
-            self.application_history['applications'].append(application_record)
-            
-            # Save updated history
-            self.save_application_history()
+                if status == 'submitted':
+                    stats['submitted'] = stats.get('submitted', 0) + 1
+                    day_stats['submitted'] += 1
+                elif status == 'failed':
+                    stats['failed'] = stats.get('failed', 0) + 1
+                    day_stats['failed'] += 1
+                elif status == 'error':
+                    stats['errors'] = stats.get('errors', 0) + 1
+                    day_stats['error'] += 1
+                
+                # Add to applications list
+                self.application_history['applications'].append(application_record)
+                self._index_application(application_record)
+                if self._application_history is not None:
+                    self._application_history.append(ApplicationRecord.from_dict(application_record))
+                
+                # Append the record and rewrite only the small stats file
+                with open(self.application_history_file, 'ab') as f:
+                    f.write(_json_dumps(application_record))
+                self._atomic_write_json(self.application_stats_file, stats)
             
             return True
             
@@ -477,64 +1489,304 @@ class JobApplicationAutomator:
             }
         }
         
+        self._migrate_legacy_history()
+        
         # Try to load from file
-        if os.path.exists(self.application_history_file):
-            try:
-                with open(self.application_history_file, 'r') as f:
-                    history = json.load(f)
-                logger.info(f"Loaded application history: {history['stats']['total_submitted']} applications")
-            except Exception as e:
-                logger.error(f"Error loading application history: {str(e)}")
+        try:
+            with open(self.application_stats_file, 'rb') as f:
+                history["stats"] = _json_loads(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading application stats: {str(e)}")
+        
+        try:
+            history["applications"] = list(self._iter_history_file())
+            logger.info(f"Loaded application history: {len(history['applications'])} applications")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading application history: {str(e)}")
+        
+        # Keep only the newest entries active
+        overflow = len(history.get("applications", [])) - self.history_max_active
+        if overflow > 0:
+            history = self._archive_applications(history, overflow)
+        
+        # Index previous applications for has_applied_to_job lookups
+        self._applied_ids = set()
+        self._applied_keys = set()
+        for app in history.get("applications", []):
+            self._index_application(app)
         
         return history
     
+    def _archive_applications(self, history, count):
+        """
+        Move the oldest applications from the history file to the archive
+        
+        Args:
+            history (dict): Application history
+            count (int): Number of applications to archive
+            
+        Returns:
+            dict: Application history without the archived applications
+        """
+        applications = history["applications"]
+        
+        try:
+            # The archive must be durable before the entries leave the history file
+            with open(self.application_history_archive_file, 'ab') as f:
+                f.write(b"".join(_json_dumps(app) for app in applications[:count]))
+                f.flush()
+                os.fsync(f.fileno())
+            
+            active = dict(history, applications=applications[count:])
+            self._atomic_write(self.application_history_file, b"".join(_json_dumps(app) for app in active["applications"]))
+            logger.info(f"Archived {count} application history entries")
+            return active
+        except Exception as e:
+            logger.error(f"Error archiving application history: {str(e)}")
+            return history
+    
+    def _index_archived_applications(self):
+        """
+        Add archived applications to the has_applied_to_job indexes, once
+        """
+        if self._archive_indexed:
+            return
+        self._archive_indexed = True
+        
+        try:
+            with open(self.application_history_archive_file, 'rb') as f:
+                for line in f:
+                    try:
+                        self._index_application(_json_loads(line))
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error indexing archived application history: {str(e)}")
+    
+    def _index_application(self, record):
+        """
+        Add an application history record to the has_applied_to_job indexes
+        
+        Args:
+            record (dict): Application history record
+        """
+        if record.get("job_id"):
+            self._applied_ids.add(record["job_id"])
+        key = self._application_key(record.get("company") or record.get("employer_name"), record.get("job_title"))
+        if key:
+            self._applied_keys.add(key)
+        
+        # A new record can turn earlier negative answers positive
+        self._applied_cache.clear()
+    
+    @staticmethod
+    def _application_key(company, job_title):
+        """
+        Build the lookup key used to detect duplicate applications
+        
+        Args:
+            company (str): Company/employer name
+            job_title (str): Job title
+            
+        Returns:
+            tuple: Lowercased (company, job_title) pair, or None if either is
+            missing, since such a pair can't identify a job
+        """
+        if not company or not job_title:
+            return None
+        return (company.lower(), job_title.lower())
+    
     def save_application_history(self):
-        """Save application history to file"""
+        """Rewrite the application history and stats files"""
         try:
-            with open(self.application_history_file, 'w') as f:
-                json.dump(self.application_history, f, indent=2)
+            history = self.application_history
+            self._atomic_write(self.application_history_file, b"".join(_json_dumps(app) for app in history["applications"]))
+            self._atomic_write_json(self.application_stats_file, history["stats"])
             logger.info("Saved application history")
         except Exception as e:
             logger.error(f"Error saving application history: {str(e)}")
     
-    def get_pending_applications(self):
+    def _iter_history_file(self):
         """
-        Get list of pending applications
+        Iterate over the records in the application history file
         
-        Returns:
-            list: List of application directories that haven't been submitted
+        Yields:
+            dict: Application history record
+        """
+        with open(self.application_history_file, 'rb') as f:
+            for line in f:
+                try:
+                    yield _json_loads(line)
+                except ValueError:
+                    # A crash can leave a partially written last line
+                    logger.warning("Skipping unreadable application history entry")
+    
+    def _migrate_legacy_history(self):
         """
-        pending = []
+        Convert application_history.json from the single-document format to
+        the JSON Lines history file and stats.json
+        """
+        legacy_file = os.path.join(self.log_dir, "application_history.json")
+        if os.path.exists(self.application_history_file) or not os.path.exists(legacy_file):
+            return
         
-        # Check all subdirectories in applications directory
-        for app_dir in os.listdir(self.application_path):
-            app_path = os.path.join(self.application_path, app_dir)
-            
-            # Skip non-directories and the logs directory
-            if not os.path.isdir(app_path) or app_dir == "logs":
-                continue
-            
-            # Check if metadata.json exists
-            metadata_path = os.path.join(app_path, "metadata.json")
-            if not os.path.exists(metadata_path):
-                continue
+        try:
+            with open(legacy_file, 'rb') as f:
+                legacy = _json_loads(f.read())
             
+            self._atomic_write(self.application_history_file, b"".join(_json_dumps(app) for app in legacy.get("applications", [])))
+            self._atomic_write_json(self.application_stats_file, legacy.get("stats", {"by_date": {}}))
+            os.replace(legacy_file, legacy_file + ".bak")
+            logger.info(f"Migrated {len(legacy.get('applications', []))} application history entries to {self.application_history_file}")
+        except Exception as e:
+            logger.error(f"Error migrating application history: {str(e)}")
+    
+    def _atomic_write_json(self, path, obj):
+        """
+        Write JSON to a temporary file and atomically move it into place
+        
+        Args:
+            path (str): Destination file path
+            obj: JSON-serializable object
+        """
+        self._atomic_write(path, _json_dumps(obj, pretty=self.debug))
+    
+    def _atomic_write(self, path, data):
+        """
+        Write bytes to a temporary file and atomically move it into place
+        
+        Args:
+            path (str): Destination file path
+            data (bytes): File contents
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _sync_log_dir(self):
+        """
+        Flush renames in the log directory to disk once per batch
+        """
+        try:
+            fd = os.open(self.log_dir, os.O_RDONLY)
             try:
-                # Load metadata
-                with open(metadata_path, 'r') as f:
-                    metadata = json.load(f)
-                
-                # Check if already submitted
-                if not metadata.get('submitted', False):
-                    pending.append({
-                        "dir": app_dir,
-                        "path": app_path,
-                        "metadata": metadata
-                    })
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            # Directories cannot be fsynced on every platform (e.g. Windows)
+            logger.debug(f"Could not sync log directory: {str(e)}")
+    
+    def iter_pending_applications(self):
+        """
+        Iterate over application directories that haven't been submitted
+        
+        Metadata is only parsed for directories whose metadata.json changed
+        since the last scan; everything else comes from the pending index.
+        
+        Yields:
+            dict: Pending application with its directory, path and metadata
+        """
+        index = self._load_pending_index()
+        seen = set()
+        changed = False
+        complete = False
+        
+        try:
+            # Check all subdirectories in applications directory
+            with os.scandir(self.application_path) as entries:
+                for entry in entries:
+                    # Skip non-directories and the logs directory
+                    if entry.name == "logs" or not entry.is_dir():
+                        continue
+                    
+                    metadata_path = os.path.join(entry.path, "metadata.json")
+                    try:
+                        mtime = os.stat(metadata_path).st_mtime_ns
+                    except FileNotFoundError:
+                        # Skip directories without metadata
+                        continue
+                    seen.add(entry.name)
+                    
+                    cached = index.get(entry.name)
+                    if cached is None or cached["mtime"] != mtime:
+                        try:
+                            with open(metadata_path, 'rb') as f:
+                                metadata = _json_loads(f.read())
+                        except Exception as e:
+                            logger.error("Error reading metadata for %s: %s", entry.name, e)
+                            continue
+                        
+                        submitted = bool(metadata.get('submitted', False))
+                        cached = {"mtime": mtime, "submitted": submitted, "metadata": None if submitted else metadata}
+                        index[entry.name] = cached
+                        changed = True
+                    
+                    # Check if already submitted
+                    if not cached["submitted"]:
+                        yield {
+                            "dir": entry.name,
+                            "path": entry.path,
+                            "metadata": cached["metadata"]
+                        }
+            complete = True
+        finally:
+            # Forget removed directories, which is only known after a full scan
+            if complete:
+                for name in index.keys() - seen:
+                    del index[name]
+                    changed = True
+            if changed:
+                self._save_pending_index()
+    
+    def _load_pending_index(self):
+        """
+        Load the index of application directory metadata, once per run
+        
+        Returns:
+            dict: Cached metadata state by directory name
+        """
+        if self._pending_index is None:
+            try:
+                with open(self.pending_index_file, 'rb') as f:
+                    self._pending_index = _json_loads(f.read())
+            except FileNotFoundError:
+                self._pending_index = {}
             except Exception as e:
-                logger.error(f"Error reading metadata for {app_dir}: {str(e)}")
+                logger.error(f"Error loading pending index: {str(e)}")
+                self._pending_index = {}
+        return self._pending_index
+    
+    def _save_pending_index(self):
+        """
+        Save the index of application directory metadata
+        """
+        try:
+            self._atomic_write_json(self.pending_index_file, self._pending_index)
+        except Exception as e:
+            logger.error(f"Error saving pending index: {str(e)}")
+    
+    def get_pending_applications(self):
+        """
+        Get list of pending applications
         
-        logger.info(f"Found {len(pending)} pending applications")
+        Returns:
+            list: List of application directories that haven't been submitted
+        """
+        pending = list(self.iter_pending_applications())
+        logger.info("Found %s pending applications", len(pending))
         return pending
     
     def check_daily_limit(self):
@@ -578,39 +1830,34 @@ class JobApplicationAutomator:
             application_dir = application.get('path')
             
             if not apply_link:
-                logger.error(f"No application link provided for {job_title} at {company}")
+                logger.error("No application link provided for %s at %s", job_title, company)
                 return False
                 
-            logger.info(f"Preparing to submit application for {job_title} at {company}")
+            logger.info("Preparing to submit application for %s at %s", job_title, company)
             
             # Check if we're in test mode
             if self.test_mode:
-                logger.info(f"Test mode: Simulating application submission for {job_title} at {company}")
-                # Randomize success/failure for testing
-                import random
-                success = random.choice([True, True, False])  # 2/3 chance of success
-                time.sleep(2)  # Simulate processing time
-                
-                if success:
-                    logger.info(f"Test mode: Successfully submitted application to {company}")
-                    self._record_application(application, "submitted")
-                    return True
-                else:
-                    logger.error(f"Test mode: Failed to submit application to {company}")
-                    self._record_application(application, "failed")
-                    return False
+                return self._simulate_application_submission(application, job_title, company)
             
-            # Get paths to resume and cover letter
-            resume_path = os.path.join(application_dir, "resume.pdf")
-            cover_letter_path = os.path.join(application_dir, "cover_letter.pdf")
+            # Get path to the resume, stopping at the first match
+            resume_names = ("resume.pdf", os.path.basename(self.resume_path))
+            resume_path = next(
+                (path for path in (os.path.join(application_dir, name) for name in resume_names) if os.path.exists(path)),
+                None
+            )
             
-            # Check that files exist
-            if not os.path.exists(resume_path):
-                logger.error(f"Resume not found at {resume_path}")
+            # Check that files exist, failing fast before the browser starts
+            if not resume_path:
+                logger.error("Resume not found in %s", application_dir)
                 return False
-                
-            if not os.path.exists(cover_letter_path):
-                logger.warning(f"Cover letter not found at {cover_letter_path}, proceeding without it")
+            
+            # A generated cover letter found by glob is known to exist; only the
+            # default PDF needs a stat
+            cover_letter_path = next((str(path) for path in Path(application_dir).glob("cover_letter_*.txt")), None)
+            if cover_letter_path is None:
+                cover_letter_path = os.path.join(application_dir, "cover_letter.pdf")
+                if not os.path.exists(cover_letter_path):
+                    logger.warning("Cover letter not found at %s, proceeding without it", cover_letter_path)
             
             # Determine which job site we're applying to
             site_type = self._detect_job_site(apply_link)
@@ -627,13 +1874,21 @@ class JobApplicationAutomator:
             
             try:
                 # Navigate to the application page
-                logger.info(f"Navigating to application page: {apply_link}")
-                driver.get(apply_link)
-                
-                # Wait for page to load
-                WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
+                logger.info("Navigating to application page: %s", apply_link)
+                # With the eager page-load strategy this returns once the DOM is ready
+                try:
+                    driver.get(apply_link)
+                except TimeoutException:
+                    raise
+                except WebDriverException as e:
+                    # The reused browser died since its last use; start a new one
+                    logger.warning("Browser session lost (%s), restarting browser", e)
+                    self._close_browser()
+                    new_driver = self._initialize_browser()
+                    if not new_driver:
+                        raise
+                    driver = new_driver
+                    driver.get(apply_link)
                 
                 # Check for CAPTCHA
                 if self._detect_and_handle_captcha(driver):
@@ -643,47 +1898,70 @@ class JobApplicationAutomator:
                 self._save_application_state(application, "page_loaded")
                 
                 # Handle site-specific application process
-                if site_type == "linkedin":
-                    success = self._apply_linkedin(driver, resume_path, cover_letter_path)
-                elif site_type == "indeed":
-                    success = self._apply_indeed(driver, resume_path, cover_letter_path)
-                elif site_type == "glassdoor":
-                    success = self._apply_glassdoor(driver, resume_path, cover_letter_path)
-                else:
-                    success = self._apply_generic(driver, resume_path, cover_letter_path)
+                apply = self._site_dispatch.get(site_type, self._apply_generic)
+                success = apply(driver, resume_path, cover_letter_path)
                 
-                # Take screenshot for record
-                screenshot_path = os.path.join(application_dir, "application_screenshot.png")
-                driver.save_screenshot(screenshot_path)
+                # Take screenshot for record when screenshots are wanted
+                if self.debug or self.capture_screenshots:
+                    self._save_screenshot_async(driver, os.path.join(application_dir, "application_screenshot.png"))
                 
                 if success:
-                    logger.info(f"Successfully submitted application to {company} for {job_title}")
+                    logger.info("Successfully submitted application to %s for %s", company, job_title)
                     # Record application in history
                     self._record_application(application, "submitted")
                     return True
                 else:
-                    logger.error(f"Failed to submit application to {company} for {job_title}")
+                    logger.error("Failed to submit application to %s for %s", company, job_title)
                     # Record application in history
                     self._record_application(application, "failed")
                     return False
                     
             except Exception as e:
-                logger.error(f"Error during application submission: {str(e)}")
-                logger.error(traceback.format_exc())
+                logger.exception("Error during application submission: %s", e)
                 # Take error screenshot
-                error_screenshot_path = os.path.join(application_dir, "error_screenshot.png")
-                driver.save_screenshot(error_screenshot_path)
+                self._save_screenshot_async(driver, os.path.join(application_dir, "error_screenshot.png"))
                 # Record application in history
                 self._record_application(application, "error", error=str(e))
+                # The page may have left the browser in a bad state
+                self._close_browser()
                 return False
                 
             finally:
-                # Close the browser
-                self._close_browser()
+                self._flush_recovery()
+                # Keep the browser for the next application
+                self._reset_browser_session()
                 
         except Exception as e:
-            logger.error(f"Error preparing application: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error preparing application: %s", e)
+            return False
+    
+    def _simulate_application_submission(self, application, job_title, company):
+        """
+        Simulate submitting an application in test mode
+        
+        Args:
+            application (dict): Application details
+            job_title (str): Job title
+            company (str): Company name
+            
+        Returns:
+            bool: True if the simulated submission succeeded, False otherwise
+        """
+        logger.info("Test mode: Simulating application submission for %s at %s", job_title, company)
+        # Randomize success/failure for testing
+        success = random.choice([True, True, False])  # 2/3 chance of success
+        
+        # Simulate processing time only when a delay is configured
+        if self.simulated_submission_delay > 0:
+            time.sleep(self.simulated_submission_delay)
+        
+        if success:
+            logger.info("Test mode: Successfully submitted application to %s", company)
+            self._record_application(application, "submitted")
+            return True
+        else:
+            logger.error("Test mode: Failed to submit application to %s", company)
+            self._record_application(application, "failed")
             return False
     
     def _detect_job_site(self, url):
@@ -696,15 +1974,8 @@ class JobApplicationAutomator:
         Returns:
             str: Site type (linkedin, indeed, glassdoor, or generic)
         """
-        url = url.lower()
-        if "linkedin.com" in url:
-            return "linkedin"
-        elif "indeed.com" in url:
-            return "indeed"
-        elif "glassdoor.com" in url:
-            return "glassdoor"
-        else:
-            return "generic"
+        match = _SITE_RE.search(url)
+        return match.group(1).lower() if match else "generic"
     
     def _apply_linkedin(self, driver, resume_path, cover_letter_path):
         """
@@ -721,39 +1992,28 @@ class JobApplicationAutomator:
         try:
             # Wait for the apply button
             try:
-                # Look for standard "Easy Apply" button
-                apply_button = None
-                apply_selectors = [
-                    ".jobs-apply-button",
-                    "button[aria-label='Easy Apply']",
-                    "button[aria-label='Apply']",
-                    "button[data-control-name='jobdetails_apply_button']"
-                ]
-                
-                for selector in apply_selectors:
-                    try:
-                        apply_button = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        if apply_button:
-                            break
-                    except TimeoutException:
-                        continue
+                # Look for standard "Easy Apply" button, taking the most
+                # specific candidate that appears
+                apply_button = self._first_clickable_in_order(driver, LINKEDIN_APPLY_SELECTORS, timeout=10)
                 
                 if not apply_button:
                     # Check if we have an "Apply on company website" button
                     try:
-                        external_apply = WebDriverWait(driver, 3).until(
+                        external_apply = self._wait(driver, 3).until(
                             EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Apply on company website']"))
                         )
                         external_apply.click()
                         logger.info("Redirected to company website for application")
                         # Wait for the new tab/window to open
-                        time.sleep(3)
+                        try:
+                            WebDriverWait(driver, 10).until(lambda d: len(d.window_handles) > 1)
+                        except TimeoutException:
+                            pass
                         
                         # Switch to the new tab if available
-                        if len(driver.window_handles) > 1:
-                            driver.switch_to.window(driver.window_handles[1])
+                        handles = driver.window_handles
+                        if len(handles) > 1:
+                            driver.switch_to.window(handles[-1])
                             logger.info(f"Switched to company website: {driver.current_url}")
                             # Now use the generic application method for the company website
                             return self._apply_generic(driver, resume_path, cover_letter_path)
@@ -774,7 +2034,7 @@ class JobApplicationAutomator:
             # Wait for the application form
             try:
                 WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-easy-apply-content"))
+                    EC.presence_of_element_located(self._LI_CONTENT)
                 )
                 logger.info("LinkedIn application form loaded")
             except TimeoutException:
@@ -783,53 +2043,37 @@ class JobApplicationAutomator:
             
             # Upload resume if resume upload field is present
             try:
-                resume_upload = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='file'][name='resume']"))
-                )
-                resume_upload.send_keys(resume_path)
-                logger.info("Resume uploaded successfully to LinkedIn")
-            except (TimeoutException, NoSuchElementException):
-                logger.warning("Resume upload field not found on LinkedIn, might be pre-filled")
+                if self._upload_file(driver, LINKEDIN_RESUME_SELECTORS, resume_path, 5):
+                    logger.info("Resume uploaded successfully to LinkedIn")
+                else:
+                    logger.warning("Resume upload field not found on LinkedIn, might be pre-filled")
+            except WebDriverException as e:
+                logger.warning(f"Error uploading resume to LinkedIn: {str(e)}")
             
             # Upload cover letter if the field is present
             try:
-                # Try different possible selectors for cover letter upload
-                cover_letter_selectors = [
-                    "input[type='file'][name='cover-letter']",
-                    "input[type='file'][name='coverLetter']",
-                    "input[type='file'][data-test-form-element-file-upload-input='']"
-                ]
-                
-                for selector in cover_letter_selectors:
-                    try:
-                        cover_letter_upload = WebDriverWait(driver, 3).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        cover_letter_upload.send_keys(cover_letter_path)
-                        logger.info("Cover letter uploaded successfully to LinkedIn")
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
+                if self._upload_file(driver, LINKEDIN_COVER_LETTER_SELECTORS, cover_letter_path, 3):
+                    logger.info("Cover letter uploaded successfully to LinkedIn")
             except Exception as e:
                 logger.warning(f"Error uploading cover letter to LinkedIn: {str(e)}")
             
             # Handle additional documents if requested
             try:
                 # Check if there's a prompt to upload additional documents
-                additional_doc_text = WebDriverWait(driver, 3).until(
+                additional_doc_text = self._wait(driver, 3).until(
                     EC.presence_of_element_located((By.XPATH, "//p[contains(text(), 'Upload additional')]"))
                 )
                 
                 # If additional documents are optional, click "Skip"
                 try:
-                    skip_button = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Skip')]"))
+                    skip_button = self._wait(driver, 3).until(
+                        ButtonWithText("Skip")
                     )
                     skip_button.click()
                     logger.info("Skipped optional additional documents on LinkedIn")
-                except:
+                except WebDriverException:
                     logger.warning("No skip button found for additional documents")
-            except:
+            except TimeoutException:
                 # No additional documents prompt, continue
                 pass
             
@@ -841,147 +2085,116 @@ class JobApplicationAutomator:
                 current_step += 1
                 logger.info(f"Processing LinkedIn application step {current_step}")
                 
-                # Wait a moment for the form to fully load
-                time.sleep(1.5)
-                
-                # Run smart field detection on the current step
-                logger.info("Running smart field detection on LinkedIn form...")
-                stats = self._smart_field_detection(driver)
-                logger.info(f"Smart field detection results: {stats}")
-                
-                # If few or no fields were filled, fall back to the existing specific field handlers
-                if stats["filled"] < 3:
-                    logger.info("Few fields filled by smart detection, falling back to specific LinkedIn handlers")
-                    self._fill_linkedin_form_fields(driver)
-                    self._handle_linkedin_custom_questions(driver)
-                
-                # Handle Work Authorization question if present
-                try:
-                    work_auth_dropdown = WebDriverWait(driver, 2).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-test-dropdown-trigger]"))
-                    )
-                    work_auth_dropdown.click()
+                # Review and confirmation steps have no form controls, so skip
+                # field detection, the field handlers and their waits and go
+                # to the buttons
+                if not self._has_form_controls(driver):
+                    logger.info("No form fields on this LinkedIn step, skipping field handlers")
+                else:
+                    # Run smart field detection on the current step
+                    logger.info("Running smart field detection on LinkedIn form...")
+                    stats = self._smart_field_detection(driver)
+                    logger.info(f"Smart field detection results: {stats}")
                     
-                    # Select "Yes, I am legally authorized" option
-                    auth_options = driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-dropdown__option")
-                    for option in auth_options:
-                        if "yes" in option.text.lower() and "authorized" in option.text.lower():
-                            option.click()
-                            logger.info("Selected 'Yes' for work authorization")
-                            break
-                except:
-                    # No work authorization dropdown on this step
-                    pass
-                
-                # Handle "How many years of X experience" questions
-                try:
-                    experience_dropdowns = driver.find_elements(By.CSS_SELECTOR, "[data-test-dropdown-trigger]")
-                    for dropdown in experience_dropdowns:
-                        if "experience" in dropdown.text.lower() or "years" in dropdown.text.lower():
-                            dropdown.click()
-                            time.sleep(1)
+                    # If few or no fields were filled, fall back to the existing specific field handlers
+                    if stats["filled"] < 3:
+                        logger.info("Few fields filled by smart detection, falling back to specific LinkedIn handlers")
+                        self._fill_linkedin_form_fields(driver)
+                        self._handle_linkedin_custom_questions(driver)
+                    
+                    # Handle dropdown questions; one lookup gates both handlers
+                    # so steps without dropdown triggers skip them entirely
+                    dropdown_triggers = driver.find_elements(*self._LI_DROPDOWN)
+                    if dropdown_triggers:
+                        # Handle Work Authorization question if present
+                        try:
+                            dropdown_triggers[0].click()
                             
-                            # Select an appropriate option (usually 2+ years)
-                            options = driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-dropdown__option")
-                            for option in options:
-                                if "2" in option.text or "two" in option.text.lower() or "3" in option.text:
+                            # Select "Yes, I am legally authorized" option
+                            auth_options = self._wait_for_linkedin_options(driver, dropdown_triggers[0])
+                            for option in auth_options:
+                                if "yes" in option.text.lower() and "authorized" in option.text.lower():
                                     option.click()
-                                    logger.info(f"Selected '{option.text}' for experience question")
+                                    logger.info("Selected 'Yes' for work authorization")
                                     break
-                except:
-                    # No experience dropdowns on this step
-                    pass
-                
-                # Handle radio buttons for yes/no questions
-                try:
-                    radio_groups = driver.find_elements(By.CSS_SELECTOR, "fieldset.fb-radio-buttons")
-                    for group in radio_groups:
-                        question_text = group.find_element(By.XPATH, "./preceding-sibling::label").text.lower()
-                        radio_buttons = group.find_elements(By.CSS_SELECTOR, "input[type='radio']")
+                        except WebDriverException:
+                            # First dropdown is not a work authorization question
+                            pass
                         
-                        # Default to "Yes" for most questions
-                        selected = False
-                        for radio in radio_buttons:
-                            # Get the label text
-                            label_id = radio.get_attribute("id")
-                            label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
+                        # Handle "How many years of X experience" questions
+                        try:
+                            for dropdown in dropdown_triggers:
+                                dropdown_text = dropdown.text.lower()
+                                if "experience" in dropdown_text or "years" in dropdown_text:
+                                    dropdown.click()
+                                    
+                                    # Select an appropriate option (usually 2+ years)
+                                    options = self._wait_for_linkedin_options(driver, dropdown)
+                                    for option in options:
+                                        if "2" in option.text or "two" in option.text.lower() or "3" in option.text:
+                                            option.click()
+                                            logger.info(f"Selected '{option.text}' for experience question")
+                                            break
+                        except WebDriverException:
+                            # Experience dropdowns changed while answering
+                            pass
+                    
+                    # Handle radio buttons for yes/no questions, resolving every
+                    # group's question and choice in a single script call
+                    try:
+                        choices = driver.execute_script(RADIO_CHOICES_JS, self._LI_RADIO_GROUP[1])
+                        for choice in choices:
+                            question_text = choice["question"].lower()
+                            choice["radio"].click()
                             
-                            if "yes" in label.text.lower():
-                                radio.click()
-                                selected = True
+                            # Default to "Yes" for most questions, otherwise the first option
+                            if choice["yes"]:
                                 logger.info(f"Selected 'Yes' for question: {question_text}")
-                                break
-                        
-                        # If no "Yes" option, select the first option
-                        if not selected and radio_buttons:
-                            radio_buttons[0].click()
-                            logger.info(f"Selected first option for question: {question_text}")
-                except Exception as e:
-                    # No radio buttons on this step
-                    pass
+                            else:
+                                logger.info(f"Selected first option for question: {question_text}")
+                    except WebDriverException:
+                        # No radio buttons on this step
+                        pass
                 
                 # Look for next or submit button
                 next_button = None
                 try:
-                    # First try to find Next button
-                    next_selectors = [
-                        "button[aria-label='Continue to next step']",
-                        "button[aria-label='Next']",
-                        "button[data-control-name='continue_unify']",
-                        "footer button:not([aria-label='Dismiss'])"
-                    ]
-                    
-                    for selector in next_selectors:
-                        try:
-                            next_button = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                            )
-                            if next_button:
-                                break
-                        except TimeoutException:
-                            continue
+                    # First try to find Next button, then any footer button
+                    # once the specific candidates have had time to appear
+                    next_button = (
+                        self._wait_for_selector(driver, LINKEDIN_NEXT_SELECTOR, 3)
+                        or self._wait_for_selector(driver, "footer button:not([aria-label='Dismiss'])", 0)
+                    )
                         
                     if not next_button:
                         # Look for "Review" button
                         try:
-                            review_button = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Review')]"))
+                            review_button = self._wait(driver, 3).until(
+                                ButtonWithText("Review")
                             )
                             review_button.click()
                             logger.info("Clicked Review button")
-                            time.sleep(2)
+                            self._wait_for_linkedin_step(driver, review_button)
                             continue
                         except TimeoutException:
                             pass
                             
                         # Look for Submit button
-                        submit_selectors = [
-                            "button[aria-label='Submit application']",
-                            "button[aria-label='Submit']",
-                            "button[data-control-name='submit_unify']",
-                            "button.jobs-apply-button"
-                        ]
-                        
-                        for selector in submit_selectors:
+                        submit_button = self._first_clickable_in_order(driver, LINKEDIN_SUBMIT_SELECTORS)
+                        if submit_button:
+                            submit_button.click()
+                            logger.info("Application submitted successfully on LinkedIn")
+                            
+                            # Wait for confirmation
                             try:
-                                submit_button = WebDriverWait(driver, 3).until(
-                                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                                WebDriverWait(driver, 10).until(
+                                    EC.presence_of_element_located((By.CSS_SELECTOR, ".artdeco-inline-feedback--success"))
                                 )
-                                submit_button.click()
-                                logger.info("Application submitted successfully on LinkedIn")
-                                
-                                # Wait for confirmation
-                                try:
-                                    WebDriverWait(driver, 10).until(
-                                        EC.presence_of_element_located((By.CSS_SELECTOR, ".artdeco-inline-feedback--success"))
-                                    )
-                                    logger.info("Received success confirmation from LinkedIn")
-                                except:
-                                    logger.warning("No success confirmation found, but submission appears completed")
-                                    
-                                return True
+                                logger.info("Received success confirmation from LinkedIn")
                             except TimeoutException:
-                                continue
+                                logger.warning("No success confirmation found, but submission appears completed")
+                                
+                            return True
                             
                         logger.error("No Next, Review, or Submit button found on LinkedIn application")
                         return False
@@ -993,7 +2206,7 @@ class JobApplicationAutomator:
                 try:
                     next_button.click()
                     logger.info("Clicked Next button, moving to next step")
-                    time.sleep(2)  # Wait for the next step to load
+                    self._wait_for_linkedin_step(driver, next_button)
                 except Exception as e:
                     logger.error(f"Error clicking Next button: {str(e)}")
                     return False
@@ -1002,10 +2215,185 @@ class JobApplicationAutomator:
             return False
             
         except Exception as e:
-            logger.error(f"Error applying on LinkedIn: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error applying on LinkedIn: {str(e)}")
             return False
     
+    def _wait_for_linkedin_step(self, driver, clicked_button, timeout=10):
+        """
+        Wait for the Easy Apply modal to move on after a Next/Review click
+        
+        The clicked button going stale marks the step change; LinkedIn keeps
+        some footer buttons across steps, so that wait is capped at two seconds
+        before falling back to the form container being present.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            clicked_button (WebElement): Button that was just clicked
+            timeout (int): Seconds to wait for the form container
+        """
+        try:
+            self._wait(driver, 2).until(EC.staleness_of(clicked_button))
+        except TimeoutException:
+            pass
+        
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located(self._LI_CONTENT)
+            )
+        except TimeoutException:
+            logger.warning("LinkedIn application step did not load in time")
+    
+    def _click_next_step(self, driver, button, timeout=5, quiet_ms=300):
+        """
+        Click a multi-step form's navigation button and wait for the next step
+        
+        Returns as soon as the DOM has changed after the click, the document
+        has loaded and the DOM has stopped changing, instead of sleeping for a
+        fixed worst-case delay. Requiring a change after the click keeps a
+        quiet page from passing before the next step's request has returned.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            button (WebElement): Navigation button to click
+            timeout (int): Maximum seconds to wait
+            quiet_ms (int): Milliseconds without DOM mutations that count as settled
+        """
+        driver.execute_script(STEP_MARKER_JS)
+        button.click()
+        
+        try:
+            self._wait(driver, timeout).until(
+                lambda d: d.execute_script(DOM_SETTLED_JS, quiet_ms)
+            )
+        except TimeoutException:
+            logger.debug("Page still changing after step wait, continuing")
+    
+    def _wait_for_linkedin_options(self, driver, dropdown=None, timeout=3):
+        """
+        Wait for an opened LinkedIn dropdown to show its options
+        
+        When the dropdown names its popup through aria-owns, the search is
+        scoped to that popup instead of the whole document.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            dropdown (WebElement): Dropdown trigger that was clicked
+            timeout (int): Seconds to wait for the first option
+            
+        Returns:
+            list: Dropdown option elements, empty if none appeared
+        """
+        option_locator = self._LI_DROPDOWN_OPTION
+        if dropdown is not None:
+            popup_id = dropdown.get_attribute("aria-owns")
+            if popup_id:
+                option_locator = (By.CSS_SELECTOR, f"[id='{popup_id}'] {self._LI_DROPDOWN_OPTION[1]}")
+        
+        try:
+            self._wait(driver, timeout).until(
+                EC.visibility_of_element_located(option_locator)
+            )
+        except TimeoutException:
+            return []
+        return driver.find_elements(*option_locator)
+    
+    def _has_form_controls(self, driver):
+        """
+        Check whether the current LinkedIn Easy Apply step has any form
+        controls to fill
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            
+        Returns:
+            bool: True if the Easy Apply modal has any non-hidden input, select,
+            textarea or fieldset
+        """
+        try:
+            return bool(self._js(driver, LINKEDIN_FORM_CONTROLS_JS))
+        except WebDriverException:
+            return True
+    
+    def _js(self, driver, script):
+        """
+        Evaluate an argument-free script body directly over CDP
+        
+        Runtime.evaluate skips the script wrapping execute_script goes through;
+        scripts that take arguments such as elements still use execute_script.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            script (str): Script body, ending in a return statement
+            
+        Returns:
+            The script's return value, serialized by value
+        """
+        result = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": f"(function() {{{script}}})()",
+            "returnByValue": True
+        })
+        if "exceptionDetails" in result:
+            raise WebDriverException(f"Script failed: {result['exceptionDetails'].get('text', '')}")
+        return result["result"].get("value")
+    
+    def _label_text(self, driver, element):
+        """
+        Get the text of an input's label in a single WebDriver command
+        
+        Uses the element's own labels collection instead of searching the
+        whole document for a label[for] match.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            element (WebElement): Input element
+            
+        Returns:
+            str: Label text, empty if the element has no label
+        """
+        try:
+            return driver.execute_script(LABEL_TEXT_JS, element) or ""
+        except WebDriverException:
+            return ""
+    
+    @functools.cached_property
+    def _linkedin_fields_mapping(self):
+        """
+        LinkedIn form values by field selector, read from the environment once
+        
+        Returns:
+            dict: Values (str or True) by CSS selector
+        """
+        # Map of field types to environment variables and default values
+        return {
+            # Text inputs
+            "input[name='phoneNumber']": os.getenv("PHONE_NUMBER", ""),
+            "input[name='phone']": os.getenv("PHONE_NUMBER", ""),
+            "input[name='email']": os.getenv("EMAIL", ""),
+            "input[name='firstName']": os.getenv("FIRST_NAME", ""),
+            "input[name='lastName']": os.getenv("LAST_NAME", ""),
+            "input[name='address']": os.getenv("ADDRESS", ""),
+            "input[name='city']": os.getenv("CITY", ""),
+            "input[name='state']": os.getenv("STATE", ""),
+            "input[name='zipCode']": os.getenv("ZIP_CODE", ""),
+            "input[name='postal']": os.getenv("ZIP_CODE", ""),
+            "input[name='website']": os.getenv("PORTFOLIO_URL", os.getenv("GITHUB_URL", "")),
+            "input[name='githubUrl']": os.getenv("GITHUB_URL", ""),
+            "input[name='portfolioUrl']": os.getenv("PORTFOLIO_URL", ""),
+            "input[name='linkedin']": os.getenv("LINKEDIN_URL", ""),
+            "input[name='salary']": os.getenv("EXPECTED_SALARY", ""),
+            
+            # Text areas (for longer text)
+            "textarea[name='additionalInfo']": os.getenv("ADDITIONAL_INFO", "I'm passionate about technology and continuously developing my skills."),
+            "textarea[name='customMessage']": os.getenv("COVER_LETTER_TEXT", "I am excited about this position and believe my skills are a perfect match..."),
+            
+            # Checkboxes
+            "input[id='follow-company-checkbox']": True,  # Checkbox to follow company
+            "input[id='contact-for-opportunities-checkbox']": True,  # Checkbox to be contacted for future opportunities
+            "input[type='checkbox'][name*='agree']": True,  # Terms agreement checkbox
+            "input[type='checkbox'][name*='privacy']": True,  # Privacy policy agreement checkbox
+            "input[type='checkbox'][name*='terms']": True,  # Terms agreement checkbox
+        }
+    
     def _fill_linkedin_form_fields(self, driver):
         """
         Fill common LinkedIn form fields
@@ -1014,71 +2402,8 @@ class JobApplicationAutomator:
             driver (WebDriver): Selenium WebDriver
         """
         try:
-            # Map of field types to environment variables and default values
-            fields_mapping = {
-                # Text inputs
-                "input[name='phoneNumber']": os.getenv("PHONE_NUMBER", ""),
-                "input[name='phone']": os.getenv("PHONE_NUMBER", ""),
-                "input[name='email']": os.getenv("EMAIL", ""),
-                "input[name='firstName']": os.getenv("FIRST_NAME", ""),
-                "input[name='lastName']": os.getenv("LAST_NAME", ""),
-                "input[name='address']": os.getenv("ADDRESS", ""),
-                "input[name='city']": os.getenv("CITY", ""),
-                "input[name='state']": os.getenv("STATE", ""),
-                "input[name='zipCode']": os.getenv("ZIP_CODE", ""),
-                "input[name='postal']": os.getenv("ZIP_CODE", ""),
-                "input[name='website']": os.getenv("PORTFOLIO_URL", os.getenv("GITHUB_URL", "")),
-                "input[name='githubUrl']": os.getenv("GITHUB_URL", ""),
-                "input[name='portfolioUrl']": os.getenv("PORTFOLIO_URL", ""),
-                "input[name='linkedin']": os.getenv("LINKEDIN_URL", ""),
-                "input[name='salary']": os.getenv("EXPECTED_SALARY", ""),
-                
-                # Text areas (for longer text)
-                "textarea[name='additionalInfo']": os.getenv("ADDITIONAL_INFO", "I'm passionate about technology and continuously developing my skills."),
-                "textarea[name='customMessage']": os.getenv("COVER_LETTER_TEXT", "I am excited about this position and believe my skills are a perfect match..."),
-                
-                # Checkboxes
-                "input[id='follow-company-checkbox']": True,  # Checkbox to follow company
-                "input[id='contact-for-opportunities-checkbox']": True,  # Checkbox to be contacted for future opportunities
-                "input[type='checkbox'][name*='agree']": True,  # Terms agreement checkbox
-                "input[type='checkbox'][name*='privacy']": True,  # Privacy policy agreement checkbox
-                "input[type='checkbox'][name*='terms']": True,  # Terms agreement checkbox
-            }
-            
-            # Process each field
-            for selector, value in fields_mapping.items():
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        # Skip hidden or disabled fields
-                        if not element.is_displayed() or not element.is_enabled():
-                            continue
-                            
-                        # Handle different element types
-                        tag_name = element.tag_name.lower()
-                        
-                        if isinstance(value, bool) and value is True:
-                            # Handle checkboxes
-                            if tag_name == "input" and element.get_attribute("type") == "checkbox" and not element.is_selected():
-                                element.click()
-                                logger.info(f"Checked checkbox with selector: {selector}")
-                        elif tag_name == "textarea":
-                            # Handle textareas
-                            element.clear()
-                            element.send_keys(value)
-                            logger.info(f"Filled textarea with selector: {selector}")
-                        else:
-                            # Handle text inputs
-                            element.clear()
-                            element.send_keys(value)
-                            logger.info(f"Filled text field with selector: {selector}")
-                except (TimeoutException, NoSuchElementException, ElementNotInteractableException) as e:
-                    # Field not present on this page, continue
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error filling field with selector {selector}: {str(e)}")
-                    continue
+            # Fill every field in a single WebDriver command
+            self._bulk_fill(driver, self._linkedin_fields_mapping)
             
             # Handle custom questions with specific text patterns
             self._handle_linkedin_custom_questions(driver)
@@ -1093,107 +2418,28 @@ class JobApplicationAutomator:
         Args:
             driver (WebDriver): Selenium WebDriver
         """
+        handlers = {
+            "salary": self._answer_linkedin_salary,
+            "start_date": self._answer_linkedin_start_date,
+            "work_auth": self._answer_linkedin_work_auth,
+        }
+        
         try:
             # Get all visible questions
-            questions = driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-form-section__grouping")
+            questions = driver.find_elements(*self._LI_QUESTION)
             
             for question in questions:
                 try:
                     # Get the question text
-                    question_element = question.find_element(By.CSS_SELECTOR, "label, legend")
-                    question_text = question_element.text.lower()
-                    
-                    # Skip if no text
-                    if not question_text:
-                        continue
-                    
-                    # Salary expectations
-                    if "salary" in question_text or "compensation" in question_text or "expected pay" in question_text:
-                        # Look for text input
-                        try:
-                            salary_input = question.find_element(By.CSS_SELECTOR, "input[type='text']")
-                            salary_input.clear()
-                            salary_input.send_keys(os.getenv("EXPECTED_SALARY", "100000"))
-                            logger.info(f"Filled salary question: {question_text}")
-                            continue
-                        except NoSuchElementException:
-                            # Maybe it's a dropdown
-                            try:
-                                dropdown = question.find_element(By.CSS_SELECTOR, "[data-test-dropdown-trigger]")
-                                dropdown.click()
-                                time.sleep(1)
-                                
-                                # Choose a value in the middle range
-                                options = driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-dropdown__option")
-                                if options:
-                                    middle_option = options[len(options) // 2]
-                                    middle_option.click()
-                                    logger.info(f"Selected middle option for salary: {middle_option.text}")
-                            except:
-                                logger.warning(f"Could not handle salary question: {question_text}")
-                            continue
+                    question_elements = question.find_elements(*self._LI_QUESTION_LABEL)
+                    question_text = question_elements[0].text.lower() if question_elements else ""
                     
-                    # Start date
-                    if "start date" in question_text or "start work" in question_text or "when can you start" in question_text:
-                        # Look for text input
-                        try:
-                            date_input = question.find_element(By.CSS_SELECTOR, "input[type='text']")
-                            date_input.clear()
-                            date_input.send_keys("Immediately")
-                            logger.info(f"Filled start date question: {question_text}")
-                        except NoSuchElementException:
-                            # Maybe it's a dropdown
-                            try:
-                                dropdown = question.find_element(By.CSS_SELECTOR, "[data-test-dropdown-trigger]")
-                                dropdown.click()
-                                time.sleep(1)
-                                
-                                # Choose immediate or 2 weeks
-                                options = driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-dropdown__option")
-                                for option in options:
-                                    if "immediate" in option.text.lower() or "right away" in option.text.lower():
-                                        option.click()
-                                        logger.info(f"Selected immediate start: {option.text}")
-                                        break
-                                else:
-                                    # If no immediate option, select first option
-                                    if options:
-                                        options[0].click()
-                                        logger.info(f"Selected first start date option: {options[0].text}")
-                            except:
-                                logger.warning(f"Could not handle start date question: {question_text}")
+                    # Skip if no text or not a question we know how to answer
+                    match = self._QUESTION_RE.match(question_text) if question_text else None
+                    if not match:
                         continue
                     
-                    # Work authorization
-                    if "authorized" in question_text or "work authorization" in question_text or "legally" in question_text and "work" in question_text:
-                        try:
-                            # Try to find Yes radio button
-                            radios = question.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                            for radio in radios:
-                                # Get the label
-                                label_id = radio.get_attribute("id")
-                                label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
-                                
-                                if "yes" in label.text.lower():
-                                    radio.click()
-                                    logger.info(f"Selected 'Yes' for work authorization")
-                                    break
-                        except:
-                            # Try dropdown
-                            try:
-                                dropdown = question.find_element(By.CSS_SELECTOR, "[data-test-dropdown-trigger]")
-                                dropdown.click()
-                                time.sleep(1)
-                                
-                                options = driver.find_elements(By.CSS_SELECTOR, ".jobs-easy-apply-dropdown__option")
-                                for option in options:
-                                    if "yes" in option.text.lower() and "authorized" in option.text.lower():
-                                        option.click()
-                                        logger.info(f"Selected 'Yes' for work authorization")
-                                        break
-                            except:
-                                logger.warning(f"Could not handle work authorization question: {question_text}")
-                        continue
+                    handlers[match.lastgroup](driver, question, question_text)
                 
                 except Exception as e:
                     logger.warning(f"Error processing question: {str(e)}")
@@ -1201,6 +2447,117 @@ class JobApplicationAutomator:
         except Exception as e:
             logger.error(f"Error handling LinkedIn custom questions: {str(e)}")
     
+    def _answer_linkedin_salary(self, driver, question, question_text):
+        """
+        Answer a LinkedIn salary expectations question
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            question (WebElement): Question container
+            question_text (str): Lowercased question text
+        """
+        # Look for text input
+        salary_inputs = question.find_elements(*self._TEXT_INPUT)
+        if salary_inputs:
+            self._set_value(driver, salary_inputs[0], os.getenv("EXPECTED_SALARY", "100000"))
+            logger.info(f"Filled salary question: {question_text}")
+            return
+        
+        # Maybe it's a dropdown
+        dropdowns = question.find_elements(*self._LI_DROPDOWN)
+        if not dropdowns:
+            logger.warning(f"Could not handle salary question: {question_text}")
+            return
+        
+        try:
+            dropdowns[0].click()
+            
+            # Choose a value in the middle range
+            options = self._wait_for_linkedin_options(driver, dropdowns[0])
+            if options:
+                middle_option = options[len(options) // 2]
+                middle_option.click()
+                logger.info(f"Selected middle option for salary: {middle_option.text}")
+        except WebDriverException:
+            logger.warning(f"Could not handle salary question: {question_text}")
+    
+    def _answer_linkedin_start_date(self, driver, question, question_text):
+        """
+        Answer a LinkedIn start date question
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            question (WebElement): Question container
+            question_text (str): Lowercased question text
+        """
+        # Look for text input
+        date_inputs = question.find_elements(*self._TEXT_INPUT)
+        if date_inputs:
+            self._set_value(driver, date_inputs[0], "Immediately")
+            logger.info(f"Filled start date question: {question_text}")
+            return
+        
+        # Maybe it's a dropdown
+        dropdowns = question.find_elements(*self._LI_DROPDOWN)
+        if not dropdowns:
+            logger.warning(f"Could not handle start date question: {question_text}")
+            return
+        
+        try:
+            dropdowns[0].click()
+            
+            # Choose immediate or 2 weeks
+            options = self._wait_for_linkedin_options(driver, dropdowns[0])
+            for option in options:
+                if "immediate" in option.text.lower() or "right away" in option.text.lower():
+                    option.click()
+                    logger.info(f"Selected immediate start: {option.text}")
+                    break
+            else:
+                # If no immediate option, select first option
+                if options:
+                    options[0].click()
+                    logger.info(f"Selected first start date option: {options[0].text}")
+        except WebDriverException:
+            logger.warning(f"Could not handle start date question: {question_text}")
+    
+    def _answer_linkedin_work_auth(self, driver, question, question_text):
+        """
+        Answer a LinkedIn work authorization question with "Yes"
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            question (WebElement): Question container
+            question_text (str): Lowercased question text
+        """
+        # Try to find Yes radio button
+        radios = question.find_elements(*self._RADIO)
+        if radios:
+            for radio in radios:
+                if "yes" in self._label_text(driver, radio).lower():
+                    radio.click()
+                    logger.info(f"Selected 'Yes' for work authorization")
+                    break
+            return
+        
+        # Try dropdown
+        dropdowns = question.find_elements(*self._LI_DROPDOWN)
+        if not dropdowns:
+            logger.warning(f"Could not handle work authorization question: {question_text}")
+            return
+        
+        try:
+            dropdowns[0].click()
+            
+            options = self._wait_for_linkedin_options(driver, dropdowns[0])
+            for option in options:
+                if "yes" in option.text.lower() and "authorized" in option.text.lower():
+                    option.click()
+                    logger.info(f"Selected 'Yes' for work authorization")
+                    break
+        except WebDriverException:
+            logger.warning(f"Could not handle work authorization question: {question_text}")
+    
     def _apply_indeed(self, driver, resume_path, cover_letter_path):
         """
         Apply to a job on Indeed
@@ -1216,7 +2573,7 @@ class JobApplicationAutomator:
         try:
             # Check if we need to sign in first
             try:
-                sign_in_button = WebDriverWait(driver, 3).until(
+                sign_in_button = self._wait(driver, 3).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-testid='login-link']"))
                 )
                 logger.warning("Indeed login required, cannot proceed with application")
@@ -1230,33 +2587,14 @@ class JobApplicationAutomator:
                 
             # Wait for the apply button
             try:
-                # Look for various apply button patterns
-                apply_button = None
-                apply_selectors = [
-                    ".jobsearch-IndeedApplyButton",
-                    "button[id*='indeed-apply-button']",
-                    "button[aria-label='Apply now']",
-                    "button.indeed-apply-button",
-                    "a[data-testid='apply-button-link']",
-                    "div.ia-IndeedApplyButton",
-                    "button:contains('Apply')"
-                ]
-                
-                for selector in apply_selectors:
-                    try:
-                        apply_button = WebDriverWait(driver, 3).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        if apply_button:
-                            break
-                    except TimeoutException:
-                        continue
+                # Look for various apply button patterns in a single query
+                apply_button = self._wait_for_selector(driver, INDEED_APPLY_SELECTOR, 5)
                 
                 if not apply_button:
                     # Check if there's an external apply button
                     try:
-                        external_apply = WebDriverWait(driver, 3).until(
-                            EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Apply on company site')]"))
+                        external_apply = self._wait(driver, 3).until(
+                            ButtonWithText("Apply on company site")
                         )
                         external_apply.click()
                         logger.info("Redirected to company website for application")
@@ -1265,8 +2603,9 @@ class JobApplicationAutomator:
                         time.sleep(3)
                         
                         # Switch to the new tab if available
-                        if len(driver.window_handles) > 1:
-                            driver.switch_to.window(driver.window_handles[1])
+                        handles = driver.window_handles
+                        if len(handles) > 1:
+                            driver.switch_to.window(handles[-1])
                             logger.info(f"Switched to company website: {driver.current_url}")
                             # Use the generic application method for the company website
                             return self._apply_generic(driver, resume_path, cover_letter_path)
@@ -1284,76 +2623,38 @@ class JobApplicationAutomator:
                 logger.error(f"Error finding Indeed apply button: {str(e)}")
                 return False
             
-            # Wait for the application iframe to load
+            # Wait for the application iframe, or for the form to show up
+            # inline, with one probe per poll
             try:
-                # Wait a bit for iframe to appear
-                time.sleep(2)
-                
-                # Try different iframe identifiers
-                iframe_found = False
-                iframe_selectors = [
-                    "iframe#indeedapply-iframe",
-                    "iframe[id*='indeed-apply']",
-                    "iframe.indeed-apply-iframe",
-                    "iframe[src*='indeed.com']"
-                ]
-                
-                for selector in iframe_selectors:
-                    try:
-                        iframe = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        driver.switch_to.frame(iframe)
-                        iframe_found = True
-                        logger.info("Switched to Indeed application iframe")
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
-                
-                if not iframe_found:
-                    # Check if we're already in the application flow (no iframe needed)
-                    try:
-                        WebDriverWait(driver, 3).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".ia-Resume-label, .ia-ContactInfo-label"))
-                        )
-                        logger.info("Already in Indeed application flow (no iframe needed)")
-                        iframe_found = True
-                    except TimeoutException:
-                        pass
+                try:
+                    probe = self._wait(driver, 10).until(
+                        lambda d: d.execute_script(INDEED_APPLY_FRAME_JS, INDEED_IFRAME_SELECTORS)
+                    )
+                except TimeoutException:
+                    fallback = driver.find_elements(By.CSS_SELECTOR, INDEED_FALLBACK_IFRAME_SELECTOR)
+                    if not fallback:
+                        logger.error("Indeed application iframe not found")
+                        return False
+                    probe = fallback[0]
                 
-                if not iframe_found:
-                    logger.error("Indeed application iframe not found")
-                    return False
+                if probe == "inline":
+                    logger.info("Already in Indeed application flow (no iframe needed)")
+                else:
+                    driver.switch_to.frame(probe)
+                    logger.info("Switched to Indeed application iframe")
             except Exception as e:
                 logger.error(f"Error switching to Indeed application iframe: {str(e)}")
                 return False
             
             # Upload resume if prompted
             try:
-                resume_selectors = [
-                    "input[type='file'][name='resume']",
-                    "input[type='file'][data-testid='resume-upload-input']",
-                    "input[type='file'][data-testid='resume-upload']",
-                    "input[type='file'][accept='.pdf,.doc,.docx']"
-                ]
-                
-                resume_uploaded = False
-                for selector in resume_selectors:
-                    try:
-                        resume_upload = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        resume_upload.send_keys(resume_path)
-                        logger.info(f"Resume uploaded to Indeed using selector: {selector}")
-                        resume_uploaded = True
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
-                
-                if not resume_uploaded:
+                selector = self._upload_file(driver, INDEED_RESUME_SELECTORS, resume_path, 5)
+                if selector:
+                    logger.info(f"Resume uploaded to Indeed using selector: {selector}")
+                else:
                     # Check if resume is already on file
                     try:
-                        resume_on_file = WebDriverWait(driver, 3).until(
+                        resume_on_file = self._wait(driver, 3).until(
                             EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Resume on file')]"))
                         )
                         logger.info("Resume already on file with Indeed")
@@ -1364,41 +2665,20 @@ class JobApplicationAutomator:
             
             # Look for "Continue with resume" button if present
             try:
-                continue_with_resume = WebDriverWait(driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Continue with resume')]"))
+                continue_with_resume = self._wait(driver, 3).until(
+                    ButtonWithText("Continue with resume")
                 )
-                continue_with_resume.click()
+                self._click_next_step(driver, continue_with_resume)
                 logger.info("Clicked 'Continue with resume' button")
-                time.sleep(2)
             except TimeoutException:
                 # Button not present, continue
                 pass
             
             # Continue button after resume upload
             try:
-                continue_selectors = [
-                    ".ia-continueButton",
-                    "button[data-testid='ia-continue-button']",
-                    "button.icl-Button--primary",
-                    "button:contains('Continue')",
-                    "button.ia-ContinueButton"
-                ]
-                
-                continue_clicked = False
-                for selector in continue_selectors:
-                    try:
-                        continue_button = WebDriverWait(driver, 3).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        continue_button.click()
-                        logger.info(f"Clicked continue button using selector: {selector}")
-                        continue_clicked = True
-                        time.sleep(2)
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
-                
-                if not continue_clicked:
+                if self._click_indeed_continue(driver):
+                    logger.info("Clicked continue button after resume upload")
+                else:
                     logger.warning("No continue button found after resume upload")
             except Exception as e:
                 logger.error(f"Error clicking continue after resume upload: {str(e)}")
@@ -1411,156 +2691,196 @@ class JobApplicationAutomator:
                 step_count += 1
                 logger.info(f"Processing Indeed application step {step_count}")
                 
-                # Wait a moment for the form to fully load
-                time.sleep(2)
-                
-                # Run smart field detection on the current step
-                logger.info("Running smart field detection on Indeed form...")
-                stats = self._smart_field_detection(driver)
-                logger.info(f"Smart field detection results: {stats}")
-                
-                # If few or no fields were filled, fall back to the existing specific field handlers
-                if stats["filled"] < 3:
-                    logger.info("Few fields filled by smart detection, falling back to specific Indeed handlers")
-                    self._fill_indeed_form_fields(driver)
-                    self._handle_indeed_common_questions(driver)
-                
-                # Handle possible cover letter prompt
+                # Count the step's controls once so review and confirmation
+                # pages skip straight to the navigation buttons
                 try:
-                    # Look for cover letter upload
-                    cover_letter_selectors = [
-                        "input[type='file'][name*='cover']",
-                        "input[type='file'][accept*='.pdf'][name!='resume']",
-                        "input[type='file'][data-testid='cover-letter-upload-input']"
-                    ]
+                    control_count = driver.execute_script(FORM_CONTROLS_JS)
+                except WebDriverException as e:
+                    logger.warning(f"Error counting Indeed form controls: {str(e)}")
+                    control_count = 3
+                
+                if control_count:
+                    # Run smart field detection on the current step
+                    logger.info("Running smart field detection on Indeed form...")
+                    stats = self._smart_field_detection(driver)
+                    logger.info(f"Smart field detection results: {stats}")
                     
-                    for selector in cover_letter_selectors:
-                        try:
-                            cover_letter_upload = WebDriverWait(driver, 3).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                            )
-                            cover_letter_upload.send_keys(cover_letter_path)
-                            logger.info("Cover letter uploaded to Indeed")
-                            break
-                        except (TimeoutException, NoSuchElementException):
-                            continue
+                    # If few or no fields were filled, fall back to the existing specific field handlers
+                    if stats["filled"] < 3:
+                        logger.info("Few fields filled by smart detection, falling back to specific Indeed handlers")
+                        # Pages with only a couple of controls are yes/no questions
+                        if control_count >= 3:
+                            self._fill_indeed_form_fields(driver)
                     
-                    # Look for cover letter text area
+                    # Handle possible cover letter prompt; the fields are
+                    # optional, so each gets only a short wait
                     try:
-                        cover_letter_textarea = WebDriverWait(driver, 3).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "textarea[name*='cover'], textarea[placeholder*='cover']"))
-                        )
-                        
-                        # If we have a cover letter file, read it and use its content
-                        cover_letter_text = os.getenv("COVER_LETTER_TEXT", "I am excited about this position and believe my skills are a perfect match...")
-                        if os.path.exists(cover_letter_path):
-                            try:
-                                with open(cover_letter_path, 'r') as f:
-                                    cover_letter_text = f.read()
-                            except Exception as e:
-                                logger.error(f"Error reading cover letter file: {str(e)}")
+                        # Look for cover letter upload
+                        if self._upload_file(driver, INDEED_COVER_LETTER_SELECTORS, cover_letter_path, 1):
+                            logger.info("Cover letter uploaded to Indeed")
                         
-                        cover_letter_textarea.clear()
-                        cover_letter_textarea.send_keys(cover_letter_text)
-                        logger.info("Filled cover letter text area")
-                    except TimeoutException:
-                        pass
-                except Exception as e:
-                    logger.error(f"Error handling cover letter: {str(e)}")
-                
-                # Handle common questions that might appear
-                self._handle_indeed_common_questions(driver)
-                
-                # Look for continue or submit button
-                next_button = None
-                try:
-                    # First try to find continue button
-                    continue_selectors = [
-                        ".ia-continueButton",
-                        "button[data-testid='ia-continue-button']",
-                        "button.icl-Button--primary",
-                        "button:contains('Continue')",
-                        "button.ia-ContinueButton"
-                    ]
-                    
-                    next_button_found = False
-                    for selector in continue_selectors:
+                        # Look for cover letter text area
                         try:
-                            next_button = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                            cover_letter_textarea = self._wait(driver, 1).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, "textarea[name*='cover'], textarea[placeholder*='cover']"))
                             )
-                            if next_button:
-                                next_button_found = True
-                                break
-                        except TimeoutException:
-                            continue
-                    
-                    if not next_button_found:
-                        # Try to find submit button
-                        submit_selectors = [
-                            ".ia-SubmitButton",
-                            "button[data-testid='ia-submit-button']",
-                            "button:contains('Submit')",
-                            "button:contains('Submit application')",
-                            "button.ia-SubmitApplication"
-                        ]
-                        
-                        for selector in submit_selectors:
-                            try:
-                                submit_button = WebDriverWait(driver, 3).until(
-                                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                                )
-                                submit_button.click()
-                                logger.info("Indeed application submitted successfully")
-                                
-                                # Wait for confirmation
-                                try:
-                                    WebDriverWait(driver, 10).until(
-                                        EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Application submitted') or contains(text(), 'Successfully submitted')]"))
-                                    )
-                                    logger.info("Received application confirmation from Indeed")
-                                except:
-                                    logger.warning("No confirmation message found, but submission button was clicked")
-                                
-                                return True
-                            except TimeoutException:
-                                continue
                             
-                        # If we get here, no continue or submit button was found
-                        logger.warning("No continue or submit button found on Indeed, checking for review button")
-                        
-                        # Check for "Review" button
-                        try:
-                            review_button = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Review')]"))
-                            )
-                            review_button.click()
-                            logger.info("Clicked Review button")
-                            time.sleep(2)
-                            continue
+                            # If we have a cover letter file, use its content
+                            cover_letter_text = self._read_cover_letter(cover_letter_path)
+                            
+                            self._set_value(driver, cover_letter_textarea, cover_letter_text)
+                            logger.info("Filled cover letter text area")
                         except TimeoutException:
-                            logger.error("No continue, submit, or review button found on Indeed")
-                            return False
-                except Exception as e:
-                    logger.error(f"Error finding navigation buttons on Indeed: {str(e)}")
-                    return False
+                            pass
+                    except Exception as e:
+                        logger.error(f"Error handling cover letter: {str(e)}")
+                    
+                    # Handle common questions that might appear, once per step
+                    # and after the other fields are filled
+                    self._handle_indeed_common_questions(driver)
                 
-                # Click continue button and wait for next page
+                # Move on with whichever navigation button the step shows
                 try:
-                    next_button.click()
-                    logger.info("Clicked continue button, moving to next step")
-                    time.sleep(2)  # Wait for the next step to load
+                    outcome = self._click_indeed_navigation(driver)
                 except Exception as e:
-                    logger.error(f"Error clicking continue button: {str(e)}")
+                    logger.error(f"Error clicking navigation buttons on Indeed: {str(e)}")
+                    return False
+                
+                if outcome == "none":
+                    logger.error("No continue, submit, or review button found on Indeed")
                     return False
+                
+                if outcome == "submitted":
+                    logger.info("Indeed application submitted successfully")
+                    
+                    # Wait for confirmation
+                    try:
+                        WebDriverWait(driver, 10).until(
+                            EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Application submitted') or contains(text(), 'Successfully submitted')]"))
+                        )
+                        logger.info("Received application confirmation from Indeed")
+                    except TimeoutException:
+                        logger.warning("No confirmation message found, but submission button was clicked")
+                    
+                    return True
+                
+                logger.info(f"Clicked {outcome} button, moving to next step")
             
             logger.warning(f"Reached maximum steps ({max_steps}) for Indeed application")
             return False
             
         except Exception as e:
-            logger.error(f"Error applying on Indeed: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error applying on Indeed: {str(e)}")
+            return False
+    
+    def _click_indeed_continue(self, driver, timeout=3):
+        """
+        Click Indeed's continue button and wait for the next step
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            timeout (float): Seconds to wait for the button
+            
+        Returns:
+            bool: True if a continue button was clicked
+        """
+        continue_button = self._first_clickable(driver, INDEED_CONTINUE_SELECTOR, ("Continue",), timeout)
+        if not continue_button:
             return False
+        
+        self._click_next_step(driver, continue_button)
+        return True
+    
+    def _click_indeed_navigation(self, driver, timeout=3):
+        """
+        Click whichever continue, review or submit button an Indeed step shows
+        
+        Continue and submit buttons are looked up with one combined selector
+        and a single wait, then the button found is classified in the browser.
+        
+        Args:
+            driver (WebDriver): Selenium WebDriver
+            timeout (float): Seconds to wait for a button
+            
+        Returns:
+            str: 'submitted', 'continue' or 'review', or 'none' if no button was found
+        """
+        nav_button = self._first_clickable(driver, INDEED_NAVIGATION_SELECTOR, ("Continue", "Submit", "Review"), timeout)
+        if not nav_button:
+            return "none"
+        
+        button_kind = driver.execute_script(INDEED_BUTTON_KIND_JS, nav_button, INDEED_SUBMIT_SELECTOR)
+        if button_kind == "submit":
+            nav_button.click()
+            return "submitted"
+        
+        self._click_next_step(driver, nav_button)
+        return button_kind
+    
+    def _read_cover_letter(self, path):
+        """
+        Get the cover letter text for a text area, reading each file once
+        
+        Args:
+            path (str): Path to the cover letter file
+            
+        Returns:
+            str: File contents, or COVER_LETTER_TEXT if the file can't be read
+        """
+        default = os.getenv("COVER_LETTER_TEXT", "I am excited about this position and believe my skills are a perfect match...")
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            return default
+        
+        text = self._cover_letter_cache.get(key)
+        if text is None:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.error(f"Error reading cover letter file: {str(e)}")
+                text = default
+            self._cover_letter_cache[key] = text
+        return text
+    
+    @functools.cached_property
+    def _indeed_fields_mapping(self):
+        """
+        Indeed form values by field selector, read from the environment once
+        
+        Returns:
+            dict: Values (str or True) by CSS selector
+        """
+        # Map of field types to environment variables and default values
+        return {
+            # Text inputs
+            "input[name*='first' i]": os.getenv("FIRST_NAME", ""),
+            "input[name*='last' i]": os.getenv("LAST_NAME", ""),
+            "input[name*='email' i]": os.getenv("EMAIL", ""),
+            "input[name*='phone' i]": os.getenv("PHONE_NUMBER", ""),
+            "input[name='address1']": os.getenv("ADDRESS", ""),
+            "input[name='city']": os.getenv("CITY", ""),
+            "input[name='state']": os.getenv("STATE", ""),
+            "input[name='zip']": os.getenv("ZIP_CODE", ""),
+            "input[name='postal']": os.getenv("ZIP_CODE", ""),
+            "input[name*='url' i]": os.getenv("PORTFOLIO_URL", os.getenv("GITHUB_URL", "")),
+            "input[name*='website' i]": os.getenv("PORTFOLIO_URL", os.getenv("GITHUB_URL", "")),
+            "input[name*='linkedin' i]": os.getenv("LINKEDIN_URL", ""),
+            "input[name*='github' i]": os.getenv("GITHUB_URL", ""),
+            "input[name*='salary' i]": os.getenv("EXPECTED_SALARY", ""),
+            
+            # Text areas
+            "textarea[name*='additional' i]": os.getenv("ADDITIONAL_INFO", "I'm passionate about technology and continuously developing my skills."),
+            "textarea[name*='summary' i]": os.getenv("PROFESSIONAL_SUMMARY", "Experienced software developer with a passion for creating efficient, maintainable code."),
+            
+            # Checkboxes
+            "input[type='checkbox'][name*='agree' i]": True,  # Agreement checkbox
+            "input[type='checkbox'][name*='consent' i]": True,  # Consent checkbox
+            "input[type='checkbox'][name*='sponsor' i]": True,  # Sponsorship checkbox
+            "input[type='checkbox'][name*='relocate' i]": self.willing_to_relocate,
+            "input[type='checkbox'][name*='remote' i]": os.getenv("WILLING_TO_WORK_REMOTE", "true").lower() == "true",
+        }
     
     def _fill_indeed_form_fields(self, driver):
         """
@@ -1570,159 +2890,73 @@ class JobApplicationAutomator:
             driver (WebDriver): Selenium WebDriver
         """
         try:
-            # Map of field types to environment variables and default values
-            fields_mapping = {
-                # Text inputs
-                "input[name*='first' i]": os.getenv("FIRST_NAME", ""),
-                "input[name*='last' i]": os.getenv("LAST_NAME", ""),
-                "input[name*='email' i]": os.getenv("EMAIL", ""),
-                "input[name*='phone' i]": os.getenv("PHONE_NUMBER", ""),
-                "input[name='address1']": os.getenv("ADDRESS", ""),
-                "input[name='city']": os.getenv("CITY", ""),
-                "input[name='state']": os.getenv("STATE", ""),
-                "input[name='zip']": os.getenv("ZIP_CODE", ""),
-                "input[name='postal']": os.getenv("ZIP_CODE", ""),
-                "input[name*='url' i]": os.getenv("PORTFOLIO_URL", os.getenv("GITHUB_URL", "")),
-                "input[name*='website' i]": os.getenv("PORTFOLIO_URL", os.getenv("GITHUB_URL", "")),
-                "input[name*='linkedin' i]": os.getenv("LINKEDIN_URL", ""),
-                "input[name*='github' i]": os.getenv("GITHUB_URL", ""),
-                "input[name*='salary' i]": os.getenv("EXPECTED_SALARY", ""),
-                
-                # Text areas
-                "textarea[name*='additional' i]": os.getenv("ADDITIONAL_INFO", "I'm passionate about technology and continuously developing my skills."),
-                "textarea[name*='summary' i]": os.getenv("PROFESSIONAL_SUMMARY", "Experienced software developer with a passion for creating efficient, maintainable code."),
-                
-                # Checkboxes
-                "input[type='checkbox'][name*='agree' i]": True,  # Agreement checkbox
-                "input[type='checkbox'][name*='consent' i]": True,  # Consent checkbox
-                "input[type='checkbox'][name*='sponsor' i]": True,  # Sponsorship checkbox
-                "input[type='checkbox'][name*='relocate' i]": os.getenv("WILLING_TO_RELOCATE", "true").lower() == "true",
-                "input[type='checkbox'][name*='remote' i]": os.getenv("WILLING_TO_WORK_REMOTE", "true").lower() == "true",
-            }
-            
-            # Process each field
-            for selector, value in fields_mapping.items():
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        # Skip hidden or disabled fields
-                        if not element.is_displayed() or not element.is_enabled():
-                            continue
-                            
-                        # Handle different element types
-                        tag_name = element.tag_name.lower()
-                        
-                        if isinstance(value, bool) and value is True:
-                            # Handle checkboxes
-                            if tag_name == "input" and element.get_attribute("type") == "checkbox" and not element.is_selected():
-                                element.click()
-                                logger.info(f"Checked checkbox with selector: {selector}")
-                        elif tag_name == "textarea":
-                            # Handle textareas
-                            element.clear()
-                            element.send_keys(value)
-                            logger.info(f"Filled textarea with selector: {selector}")
-                        else:
-                            # Handle text inputs
-                            element.clear()
-                            element.send_keys(value)
-                            logger.info(f"Filled text field with selector: {selector}")
-                except (TimeoutException, NoSuchElementException):
-                    # Field not present on this page, continue
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error filling field with selector {selector}: {str(e)}")
-                    continue
+            # Fill every field in a single WebDriver command
+            self._bulk_fill(driver, self._indeed_fields_mapping)
             
             # Look for select/dropdown elements
             try:
-                selects = driver.find_elements(By.TAG_NAME, "select")
-                for select_element in selects:
-                    select_id = select_element.get_attribute("id")
-                    select_name = select_element.get_attribute("name")
-                    
-                    # Skip if not visible
-                    if not select_element.is_displayed():
-                        continue
+                # Read the visible selects and all their options in one call,
+                # then select by index rather than clicking option elements
+                for select_info in driver.execute_script(VISIBLE_SELECTS_JS):
+                    select_element = select_info["element"]
+                    select_name = select_info["name"]
+                    options = select_info["options"]
+                    select = Select(select_element)
                     
                     # Handle different types of dropdowns based on name/id
-                    if select_name and ("education" in select_name.lower() or "degree" in select_name.lower()):
+                    if _EDUCATION_SELECT_RE.search(select_name):
                         # Select Bachelor's degree or highest available
-                        options = select_element.find_elements(By.TAG_NAME, "option")
-                        selected = False
-                        
-                        # Look for specific degree values
                         degree_keywords = ["bachelor", "bs", "ba", "master", "ms", "ma"]
-                        for option in options:
-                            option_text = option.text.lower()
-                            if any(keyword in option_text for keyword in degree_keywords):
-                                option.click()
-                                logger.info(f"Selected education: {option.text}")
-                                selected = True
-                                break
+                        index = next((i for i, (_, text) in enumerate(options)
+                                      if any(keyword in text.lower() for keyword in degree_keywords)), None)
                         
+                        if index is not None:
+                            select.select_by_index(index)
+                            logger.info(f"Selected education: {options[index][1]}")
                         # If no specific degree found, select the middle option
-                        if not selected and len(options) > 1:
+                        elif len(options) > 1:
                             # Skip the first option (usually a placeholder)
                             mid_index = min(len(options) - 1, 2)
-                            options[mid_index].click()
-                            logger.info(f"Selected education (default): {options[mid_index].text}")
+                            select.select_by_index(mid_index)
+                            logger.info(f"Selected education (default): {options[mid_index][1]}")
                     
-                    elif select_name and ("experience" in select_name.lower() or "years" in select_name.lower()):
+                    elif _EXPERIENCE_SELECT_RE.search(select_name):
                         # Select 2-3 years experience or middle option
-                        options = select_element.find_elements(By.TAG_NAME, "option")
-                        selected = False
-                        
-                        for option in options:
-                            option_text = option.text.lower()
-                            if "2" in option_text or "two" in option_text or "3" in option_text or "three" in option_text:
-                                option.click()
-                                logger.info(f"Selected experience: {option.text}")
-                                selected = True
-                                break
+                        index = next((i for i, (_, text) in enumerate(options)
+                                      if any(years in text.lower() for years in ("2", "two", "3", "three"))), None)
                         
+                        if index is not None:
+                            select.select_by_index(index)
+                            logger.info(f"Selected experience: {options[index][1]}")
                         # If no specific experience found, select the middle option
-                        if not selected and len(options) > 1:
+                        elif len(options) > 1:
                             # Skip the first option (usually a placeholder)
                             mid_index = min(len(options) - 1, 2)
-                            options[mid_index].click()
-                            logger.info(f"Selected experience (default): {options[mid_index].text}")
+                            select.select_by_index(mid_index)
+                            logger.info(f"Selected experience (default): {options[mid_index][1]}")
                     
-                    elif select_name and ("state" in select_name.lower() or "province" in select_name.lower()):
-                        # Select the provided state
-                        state = os.getenv("STATE", "CA")
-                        options = select_element.find_elements(By.TAG_NAME, "option")
-                        selected = False
-                        
-                        for option in options:
-                            option_value = option.get_attribute("value")
-                            option_text = option.text
-                            
-                            if (option_value and option_value.upper() == state.upper()) or \
-                               (option_text and state.upper() in option_text.upper()):
-                                option.click()
-                                logger.info(f"Selected state: {option.text}")
-                                selected = True
-                                break
+                    elif _STATE_SELECT_RE.search(select_name):
+                        # Select the provided state by option value or text
+                        state = os.getenv("STATE", "CA").upper()
+                        index = next((i for i, (value, text) in enumerate(options)
+                                      if value.upper() == state or state in text.upper()), None)
                         
+                        if index is not None:
+                            select.select_by_index(index)
+                            logger.info(f"Selected state: {options[index][1]}")
                         # If state not found, leave as default
-                        if not selected:
+                        else:
                             logger.warning(f"Could not select state: {state}")
                     
                     # If it's any other dropdown and nothing is selected, select the first non-empty option
                     else:
-                        options = select_element.find_elements(By.TAG_NAME, "option")
-                        current_selection = select_element.get_attribute("value")
-                        
                         # If nothing selected, choose first real option
-                        if not current_selection and len(options) > 1:
-                            for option in options[1:]:  # Skip first (usually placeholder)
-                                option_value = option.get_attribute("value")
-                                if option_value:
-                                    option.click()
-                                    logger.info(f"Selected default for dropdown: {option.text}")
-                                    break
+                        if not select_info["value"] and len(options) > 1:
+                            # Skip first (usually placeholder)
+                            index = next((i for i, (value, _) in enumerate(options[1:], 1) if value), None)
+                            if index is not None:
+                                select.select_by_index(index)
+                                logger.info(f"Selected default for dropdown: {options[index][1]}")
             except Exception as e:
                 logger.warning(f"Error handling select fields: {str(e)}")
         
@@ -1733,129 +2967,22 @@ class JobApplicationAutomator:
         """
         Handle common Indeed application questions
         
+        All radio groups are resolved and clicked by a single script call.
+        
         Args:
             driver (WebDriver): Selenium WebDriver
         """
         try:
-            # Handle radio button groups
-            radio_groups = driver.find_elements(By.CSS_SELECTOR, "fieldset")
-            
-            for group in radio_groups:
-                try:
-                    # Get the question text if available
-                    question_text = ""
-                    try:
-                        question_element = group.find_element(By.XPATH, "./preceding-sibling::*[1]")
-                        question_text = question_element.text.lower()
-                    except:
-                        # If no preceding sibling, try to find legend
-                        try:
-                            legend = group.find_element(By.TAG_NAME, "legend")
-                            question_text = legend.text.lower()
-                        except:
-                            pass
-                    
-                    # Skip if we couldn't find the question text
-                    if not question_text:
-                        continue
-                    
-                    # Get all radio buttons in this group
-                    radio_buttons = group.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                    if not radio_buttons:
-                        continue
-                    
-                    # Handle based on question type
-                    selected = False
-                    
-                    # Work authorization questions
-                    if "authorized" in question_text or "legally" in question_text and "work" in question_text:
-                        # Select "Yes" for work authorization
-                        for radio in radio_buttons:
-                            # Get the label
-                            try:
-                                label_id = radio.get_attribute("id")
-                                label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
-                                
-                                if "yes" in label.text.lower():
-                                    radio.click()
-                                    logger.info(f"Selected 'Yes' for work authorization question: {question_text}")
-                                    selected = True
-                                    break
-                            except:
-                                continue
-                    
-                    # Sponsorship questions (usually want to answer "No")
-                    elif "sponsor" in question_text or "sponsorship" in question_text:
-                        # In most cases, employers prefer candidates who don't need sponsorship
-                        need_sponsorship = os.getenv("NEED_SPONSORSHIP", "false").lower() == "true"
-                        
-                        for radio in radio_buttons:
-                            try:
-                                label_id = radio.get_attribute("id")
-                                label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
-                                
-                                if need_sponsorship and "yes" in label.text.lower():
-                                    radio.click()
-                                    logger.info(f"Selected 'Yes' for sponsorship question: {question_text}")
-                                    selected = True
-                                    break
-                                elif not need_sponsorship and "no" in label.text.lower():
-                                    radio.click()
-                                    logger.info(f"Selected 'No' for sponsorship question: {question_text}")
-                                    selected = True
-                                    break
-                            except:
-                                continue
-                    
-                    # Relocation questions
-                    elif "relocate" in question_text or "relocation" in question_text:
-                        willing_to_relocate = os.getenv("WILLING_TO_RELOCATE", "true").lower() == "true"
-                        
-                        for radio in radio_buttons:
-                            try:
-                                label_id = radio.get_attribute("id")
-                                label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
-                                
-                                if willing_to_relocate and "yes" in label.text.lower():
-                                    radio.click()
-                                    logger.info(f"Selected 'Yes' for relocation question: {question_text}")
-                                    selected = True
-                                    break
-                                elif not willing_to_relocate and "no" in label.text.lower():
-                                    radio.click()
-                                    logger.info(f"Selected 'No' for relocation question: {question_text}")
-                                    selected = True
-                                    break
-                            except:
-                                continue
-                    
-                    # Generic yes/no questions - default to "Yes" for most questions
-                    elif not selected and len(radio_buttons) == 2:
-                        # Assume it's a yes/no question and select "Yes"
-                        for radio in radio_buttons:
-                            try:
-                                label_id = radio.get_attribute("id")
-                                label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
-                                
-                                if "yes" in label.text.lower():
-                                    radio.click()
-                                    logger.info(f"Selected 'Yes' for question: {question_text}")
-                                    selected = True
-                                    break
-                            except:
-                                continue
-                    
-                    # If still not selected and there are radio buttons, select the first one
-                    if not selected and radio_buttons:
-                        try:
-                            radio_buttons[0].click()
-                            logger.info(f"Selected first option for question: {question_text}")
-                        except:
-                            logger.warning(f"Could not select any option for question: {question_text}")
-                
-                except Exception as e:
-                    logger.warning(f"Error processing radio group: {str(e)}")
-                    continue
+            answers = driver.execute_script(INDEED_RADIO_ANSWERS_JS, {
+                "needSponsorship": self.need_sponsorship,
+                "willingToRelocate": self.willing_to_relocate
+            })
+            
+            for answer in answers:
+                if answer["answer"]:
+                    logger.info(f"Selected '{answer['answer'].capitalize()}' for {answer['kind']} question: {answer['question']}")
+                else:
+                    logger.info(f"Selected first option for question: {answer['question']}")
             
         except Exception as e:
             logger.error(f"Error handling Indeed common questions: {str(e)}")
@@ -1887,26 +3014,8 @@ class JobApplicationAutomator:
             
             # Wait for the apply button
             try:
-                # Look for various apply button patterns
-                apply_button = None
-                apply_selectors = [
-                    ".applyButton",
-                    "button[data-test='apply-button']",
-                    "a.gd-ui-button[data-test='apply-button']",
-                    "button:contains('Apply Now')",
-                    "button:contains('Easy Apply')",
-                    "a[href*='glassdoor.com/partner/jobListing.htm']"
-                ]
-                
-                for selector in apply_selectors:
-                    try:
-                        apply_button = WebDriverWait(driver, 3).until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        if apply_button:
-                            break
-                    except TimeoutException:
-                        continue
+                # Look for various apply button patterns in priority order
+                apply_button = self._first_clickable_in_order(driver, GLASSDOOR_APPLY_SELECTORS, ("Apply Now", "Easy Apply"))
                 
                 if not apply_button:
                     # Check for an "Apply on company website" button
@@ -1921,8 +3030,9 @@ class JobApplicationAutomator:
                         time.sleep(3)
                         
                         # Switch to the new tab if available
-                        if len(driver.window_handles) > 1:
-                            driver.switch_to.window(driver.window_handles[1])
+                        handles = driver.window_handles
+                        if len(handles) > 1:
+                            driver.switch_to.window(handles[-1])
                             logger.info(f"Switched to company website: {driver.current_url}")
                             # Now use the generic application method for the company website
                             return self._apply_generic(driver, resume_path, cover_letter_path)
@@ -1961,7 +3071,7 @@ class JobApplicationAutomator:
             # First check for "continue with resume" option
             try:
                 continue_with_resume = WebDriverWait(driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Continue with Resume') or contains(text(), 'Continue with resume')]"))
+                    ButtonWithText("Continue with Resume", "Continue with resume")
                 )
                 continue_with_resume.click()
                 logger.info("Clicked 'Continue with resume' button on Glassdoor")
@@ -1972,50 +3082,19 @@ class JobApplicationAutomator:
             
             # Upload resume if prompt exists
             try:
-                resume_selectors = [
-                    "input[type='file'][name='resume']",
-                    "input[type='file'][name='resumeFile']",
-                    "input[type='file'][accept='.doc,.docx,.pdf']",
-                    "input[type='file'][data-test='resume-upload-input']"
-                ]
-                
-                resume_uploaded = False
-                for selector in resume_selectors:
-                    try:
-                        resume_upload = WebDriverWait(driver, 3).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        resume_upload.send_keys(resume_path)
-                        logger.info(f"Resume uploaded to Glassdoor using selector: {selector}")
-                        resume_uploaded = True
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
-                
-                if not resume_uploaded:
+                selector = self._upload_file(driver, GLASSDOOR_RESUME_SELECTORS, resume_path, 3)
+                if selector:
+                    logger.info(f"Resume uploaded to Glassdoor using selector: {selector}")
+                else:
                     logger.warning("Could not find resume upload field on Glassdoor")
             except Exception as e:
                 logger.error(f"Error uploading resume to Glassdoor: {str(e)}")
             
             # Upload cover letter if field exists
             try:
-                cover_letter_selectors = [
-                    "input[type='file'][name='coverLetter']",
-                    "input[type='file'][name='coverLetterFile']",
-                    "input[type='file'][accept='.doc,.docx,.pdf,.txt'][name!='resume']",
-                    "input[type='file'][data-test='coverletter-upload-input']"
-                ]
-                
-                for selector in cover_letter_selectors:
-                    try:
-                        cover_letter_upload = WebDriverWait(driver, 3).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        cover_letter_upload.send_keys(cover_letter_path)
-                        logger.info(f"Cover letter uploaded to Glassdoor using selector: {selector}")
-                        break
-                    except (TimeoutException, NoSuchElementException):
-                        continue
+                selector = self._upload_file(driver, GLASSDOOR_COVER_LETTER_SELECTORS, cover_letter_path, 3)
+                if selector:
+                    logger.info(f"Cover letter uploaded to Glassdoor using selector: {selector}")
                 
                 # Look for cover letter text area as alternative
                 try:
@@ -2023,17 +3102,10 @@ class JobApplicationAutomator:
                         EC.presence_of_element_located((By.CSS_SELECTOR, "textarea[name*='cover'], textarea[placeholder*='cover']"))
                     )
                     
-                    # If we have a cover letter file, read it and use its content
-                    cover_letter_text = os.getenv("COVER_LETTER_TEXT", "I am excited about this position and believe my skills are a perfect match...")
-                    if os.path.exists(cover_letter_path):
-                        try:
-                            with open(cover_letter_path, 'r') as f:
-                                cover_letter_text = f.read()
-                        except Exception as e:
-                            logger.error(f"Error reading cover letter file: {str(e)}")
+                    # If we have a cover letter file, use its content
+                    cover_letter_text = self._read_cover_letter(cover_letter_path)
                     
-                    cover_letter_textarea.clear()
-                    cover_letter_textarea.send_keys(cover_letter_text)
+                    self._set_value(driver, cover_letter_textarea, cover_letter_text)
                     logger.info("Filled cover letter text area on Glassdoor")
                 except TimeoutException:
                     logger.warning("No cover letter text area found on Glassdoor")
@@ -2072,68 +3144,34 @@ class JobApplicationAutomator:
                 next_button = None
                 try:
                     # First try to find continue button
-                    continue_selectors = [
-                        "button[data-test='continue-button']",
-                        "button.e1ulk49s0",
-                        "button:contains('Continue')",
-                        "button:contains('Next')",
-                        "button.continueButton"
-                    ]
-                    
-                    next_button_found = False
-                    for selector in continue_selectors:
-                        try:
-                            next_button = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                            )
-                            if next_button:
-                                next_button_found = True
-                                break
-                        except TimeoutException:
-                            continue
+                    next_button = self._first_clickable_in_order(driver, GLASSDOOR_CONTINUE_SELECTORS, ("Continue", "Next"))
                     
-                    if not next_button_found:
-                        # Try to find review button
-                        try:
-                            review_button = WebDriverWait(driver, 3).until(
-                                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Review')]"))
-                            )
+                    if not next_button:
+                        # The continue wait gave the step time to render, so
+                        # review and submit buttons are only probed once
+                        review_button = ButtonWithText("Review")(driver)
+                        if review_button:
                             review_button.click()
                             logger.info("Clicked Review button on Glassdoor")
                             time.sleep(2)
                             continue
-                        except TimeoutException:
-                            pass
                         
                         # Try to find submit button
-                        submit_selectors = [
-                            "button[data-test='submit-button']",
-                            "button[type='submit']",
-                            "button:contains('Submit')",
-                            "button:contains('Submit Application')",
-                            "button.submit"
-                        ]
-                        
-                        for selector in submit_selectors:
+                        submit_button = self._first_clickable_in_order(driver, GLASSDOOR_SUBMIT_SELECTORS, ("Submit",), 0)
+                        if submit_button:
+                            submit_button.click()
+                            logger.info("Glassdoor application submitted successfully")
+                            
+                            # Wait for confirmation
                             try:
-                                submit_button = WebDriverWait(driver, 3).until(
-                                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                                WebDriverWait(driver, 10).until(
+                                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Application submitted') or contains(text(), 'Successfully submitted')]"))
                                 )
-                                submit_button.click()
-                                logger.info("Glassdoor application submitted successfully")
-                                
-                                # Wait for confirmation
-                                try:
-                                    WebDriverWait(driver, 10).until(
-                                        EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Application submitted') or contains(text(), 'Successfully submitted')]"))
-                                    )
-                                    logger.info("Received application confirmation from Glassdoor")
-                                except:
-                                    logger.warning("No confirmation message found, but submission button was clicked")
-                                
-                                return True
+                                logger.info("Received application confirmation from Glassdoor")
                             except TimeoutException:
-                                continue
+                                logger.warning("No confirmation message found, but submission button was clicked")
+                            
+                            return True
                         
                         # If we get here, we couldn't find any navigation buttons
                         logger.error("No continue, review, or submit button found on Glassdoor")
@@ -2155,10 +3193,45 @@ class JobApplicationAutomator:
             return False
                 
         except Exception as e:
-            logger.error(f"Error applying on Glassdoor: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error applying on Glassdoor: {str(e)}")
             return False
     
+    @functools.cached_property
+    def _glassdoor_fields_mapping(self):
+        """
+        Glassdoor form values by field selector, read from the environment once
+        
+        Returns:
+            dict: Values (str or True) by CSS selector
+        """
+        # Map of field types to environment variables and default values
+        return {
+            # Text inputs
+            "input[name='firstName']": os.getenv("FIRST_NAME", ""),
+            "input[name='lastName']": os.getenv("LAST_NAME", ""),
+            "input[name='email']": os.getenv("EMAIL", ""),
+            "input[name='phoneNumber']": os.getenv("PHONE_NUMBER", ""),
+            "input[name='phone']": os.getenv("PHONE_NUMBER", ""),
+            "input[name='address']": os.getenv("ADDRESS", ""),
+            "input[name='city']": os.getenv("CITY", ""),
+            "input[name='zip']": os.getenv("ZIP_CODE", ""),
+            "input[name='postal']": os.getenv("ZIP_CODE", ""),
+            "input[name='workExperience']": os.getenv("YEARS_EXPERIENCE", "2"),
+            "input[name='linkedinUrl']": os.getenv("LINKEDIN_URL", ""),
+            "input[name='portfolioUrl']": os.getenv("PORTFOLIO_URL", ""),
+            "input[name='githubUrl']": os.getenv("GITHUB_URL", ""),
+            "input[name='desiredSalary']": os.getenv("EXPECTED_SALARY", ""),
+            
+            # Text areas
+            "textarea[name='additionalInformation']": os.getenv("ADDITIONAL_INFO", "I'm passionate about technology and continuously developing my skills."),
+            "textarea[name='customMessage']": os.getenv("COVER_LETTER_TEXT", "I am excited about this position and believe my skills are a perfect match..."),
+            
+            # Checkboxes
+            "input[type='checkbox'][name*='agree']": True,
+            "input[type='checkbox'][name*='privacy']": True,
+            "input[type='checkbox'][name*='terms']": True,
+        }
+    
     def _fill_glassdoor_form_fields(self, driver):
         """
         Fill common Glassdoor form fields
@@ -2167,68 +3240,8 @@ class JobApplicationAutomator:
             driver (WebDriver): Selenium WebDriver
         """
         try:
-            # Map of field types to environment variables and default values
-            fields_mapping = {
-                # Text inputs
-                "input[name='firstName']": os.getenv("FIRST_NAME", ""),
-                "input[name='lastName']": os.getenv("LAST_NAME", ""),
-                "input[name='email']": os.getenv("EMAIL", ""),
-                "input[name='phoneNumber']": os.getenv("PHONE_NUMBER", ""),
-                "input[name='phone']": os.getenv("PHONE_NUMBER", ""),
-                "input[name='address']": os.getenv("ADDRESS", ""),
-                "input[name='city']": os.getenv("CITY", ""),
-                "input[name='zip']": os.getenv("ZIP_CODE", ""),
-                "input[name='postal']": os.getenv("ZIP_CODE", ""),
-                "input[name='workExperience']": os.getenv("YEARS_EXPERIENCE", "2"),
-                "input[name='linkedinUrl']": os.getenv("LINKEDIN_URL", ""),
-                "input[name='portfolioUrl']": os.getenv("PORTFOLIO_URL", ""),
-                "input[name='githubUrl']": os.getenv("GITHUB_URL", ""),
-                "input[name='desiredSalary']": os.getenv("EXPECTED_SALARY", ""),
-                
-                # Text areas
-                "textarea[name='additionalInformation']": os.getenv("ADDITIONAL_INFO", "I'm passionate about technology and continuously developing my skills."),
-                "textarea[name='customMessage']": os.getenv("COVER_LETTER_TEXT", "I am excited about this position and believe my skills are a perfect match..."),
-                
-                # Checkboxes
-                "input[type='checkbox'][name*='agree']": True,
-                "input[type='checkbox'][name*='privacy']": True,
-                "input[type='checkbox'][name*='terms']": True,
-            }
-            
-            # Process each field
-            for selector, value in fields_mapping.items():
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for element in elements:
-                        # Skip hidden or disabled fields
-                        if not element.is_displayed() or not element.is_enabled():
-                            continue
-                            
-                        # Handle different element types
-                        tag_name = element.tag_name.lower()
-                        
-                        if isinstance(value, bool) and value is True:
-                            # Handle checkboxes
-                            if tag_name == "input" and element.get_attribute("type") == "checkbox" and not element.is_selected():
-                                element.click()
-                                logger.info(f"Checked checkbox with selector: {selector}")
-                        elif tag_name == "textarea":
-                            # Handle textareas
-                            element.clear()
-                            element.send_keys(value)
-                            logger.info(f"Filled textarea with selector: {selector}")
-                        else:
-                            # Handle text inputs
-                            element.clear()
-                            element.send_keys(value)
-                            logger.info(f"Filled text field with selector: {selector}")
-                except (TimeoutException, NoSuchElementException):
-                    # Field not present on this page, continue
-                    continue
-                except Exception as e:
-                    logger.warning(f"Error filling field with selector {selector}: {str(e)}")
-                    continue
+            # Fill every field in a single WebDriver command
+            self._bulk_fill(driver, self._glassdoor_fields_mapping)
             
             # Handle select/dropdown elements
             try:
@@ -2256,7 +3269,7 @@ class JobApplicationAutomator:
                                 break
                     
                     # Handle highest education level
-                    elif "education" in select_name.lower() or "degree" in select_name.lower():
+                    elif _EDUCATION_SELECT_RE.search(select_name):
                         education_level = os.getenv("EDUCATION_LEVEL", "Bachelor's Degree")
                         options = select_element.find_elements(By.TAG_NAME, "option")
                         
@@ -2296,6 +3309,9 @@ class JobApplicationAutomator:
         try:
             # Look for radio button groups - common for yes/no questions
             try:
+                # Fetch every radio label once instead of querying per radio
+                labels = driver.execute_script(LABEL_FOR_MAP_JS)
+                
                 # Find all possible question containers
                 question_containers = driver.find_elements(By.CSS_SELECTOR, ".questionContainer, .form-group, fieldset")
                 
@@ -2323,11 +3339,9 @@ class JobApplicationAutomator:
                         if "authorized" in question_text or "legally" in question_text and "work" in question_text:
                             for radio in radio_buttons:
                                 try:
-                                    # Get the label text
-                                    label_id = radio.get_attribute("id")
-                                    label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
+                                    label_text = labels.get(radio.get_attribute("id"), "")
                                     
-                                    if "yes" in label.text.lower():
+                                    if "yes" in label_text:
                                         radio.click()
                                         logger.info(f"Selected 'Yes' for work authorization: {question_text}")
                                         selected = True
@@ -2337,19 +3351,18 @@ class JobApplicationAutomator:
                         
                         # Sponsorship questions
                         elif "sponsor" in question_text or "sponsorship" in question_text:
-                            need_sponsorship = os.getenv("NEED_SPONSORSHIP", "false").lower() == "true"
+                            need_sponsorship = self.need_sponsorship
                             
                             for radio in radio_buttons:
                                 try:
-                                    label_id = radio.get_attribute("id")
-                                    label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
+                                    label_text = labels.get(radio.get_attribute("id"), "")
                                     
-                                    if need_sponsorship and "yes" in label.text.lower():
+                                    if need_sponsorship and "yes" in label_text:
                                         radio.click()
                                         logger.info(f"Selected 'Yes' for sponsorship question: {question_text}")
                                         selected = True
                                         break
-                                    elif not need_sponsorship and "no" in label.text.lower():
+                                    elif not need_sponsorship and "no" in label_text:
                                         radio.click()
                                         logger.info(f"Selected 'No' for sponsorship question: {question_text}")
                                         selected = True
@@ -2361,10 +3374,9 @@ class JobApplicationAutomator:
                         elif not selected and len(radio_buttons) == 2:
                             for radio in radio_buttons:
                                 try:
-                                    label_id = radio.get_attribute("id")
-                                    label = driver.find_element(By.XPATH, f"//label[@for='{label_id}']")
+                                    label_text = labels.get(radio.get_attribute("id"), "")
                                     
-                                    if "yes" in label.text.lower():
+                                    if "yes" in label_text:
                                         radio.click()
                                         logger.info(f"Selected 'Yes' for question: {question_text}")
                                         selected = True
@@ -2409,84 +3421,41 @@ class JobApplicationAutomator:
             logger.info(f"Smart field detection results: {stats}")
             
             # Look for common file upload elements for resume
-            resume_selectors = [
-                "input[type='file'][name*='resume' i]",
-                "input[type='file'][id*='resume' i]",
-                "input[type='file'][name*='cv' i]",
-                "input[type='file'][id*='cv' i]",
-                "input[type='file'][name*='file' i]",
-                "input[type='file']"  # Generic fallback
-            ]
-            
-            resume_uploaded = False
-            for selector in resume_selectors:
-                try:
-                    resume_upload = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    resume_upload.send_keys(resume_path)
-                    logger.info(f"Resume uploaded using selector: {selector}")
-                    resume_uploaded = True
-                    break
-                except (TimeoutException, NoSuchElementException, ElementNotInteractableException):
-                    continue
+            try:
+                selector = self._upload_file(driver, GENERIC_RESUME_SELECTORS, resume_path, 3)
+            except WebDriverException as e:
+                logger.warning(f"Error uploading resume: {str(e)}")
+                selector = None
             
-            if not resume_uploaded:
+            if selector:
+                logger.info(f"Resume uploaded using selector: {selector}")
+            else:
                 logger.warning("Could not find resume upload field")
             
             # Look for common file upload elements for cover letter
-            cover_letter_selectors = [
-                "input[type='file'][name*='cover' i]",
-                "input[type='file'][id*='cover' i]",
-                "input[type='file'][name*='letter' i]",
-                "input[type='file'][id*='letter' i]"
-            ]
-            
-            cover_letter_uploaded = False
-            for selector in cover_letter_selectors:
-                try:
-                    cover_letter_upload = WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    cover_letter_upload.send_keys(cover_letter_path)
-                    logger.info(f"Cover letter uploaded using selector: {selector}")
-                    cover_letter_uploaded = True
-                    break
-                except (TimeoutException, NoSuchElementException, ElementNotInteractableException):
-                    continue
+            try:
+                selector = self._upload_file(driver, GENERIC_COVER_LETTER_SELECTORS, cover_letter_path, 3)
+            except WebDriverException as e:
+                logger.warning(f"Error uploading cover letter: {str(e)}")
+                selector = None
             
-            if not cover_letter_uploaded:
+            if selector:
+                logger.info(f"Cover letter uploaded using selector: {selector}")
+            else:
                 logger.warning("Could not find cover letter upload field")
             
             # Fill common form fields
             self._fill_generic_form_fields(driver)
             
-            # Look for submit button
-            submit_selectors = [
-                "button[type='submit']",
-                "input[type='submit']",
-                "button[id*='submit' i]",
-                "button[class*='submit' i]",
-                "button[id*='apply' i]",
-                "button[class*='apply' i]",
-                "a[id*='apply' i]",
-                "a[class*='apply' i]"
-            ]
-            
-            submit_clicked = False
-            for selector in submit_selectors:
-                try:
-                    submit_button = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    submit_button.click()
-                    logger.info(f"Submit button clicked using selector: {selector}")
-                    submit_clicked = True
-                    break
-                except (TimeoutException, NoSuchElementException, ElementNotInteractableException):
-                    continue
-            
-            if not submit_clicked:
+            # Look for submit button, waiting once for any candidate and
+            # taking the most specific one that is clickable
+            try:
+                submit_button, selector = self._wait(driver, 3).until(
+                    lambda d: d.execute_script(FIRST_CLICKABLE_JS, GENERIC_SUBMIT_SELECTORS)
+                )
+                submit_button.click()
+                logger.info(f"Submit button clicked using selector: {selector}")
+            except (TimeoutException, ElementNotInteractableException, ElementClickInterceptedException):
                 logger.warning("Could not find submit button")
                 return False
             
@@ -2517,12 +3486,14 @@ class JobApplicationAutomator:
             logger.error(f"Error applying on generic site: {str(e)}")
             return False
     
-    def _fill_generic_form_fields(self, driver):
+    @functools.cached_property
+    def _generic_fields_mapping(self):
         """
-        Fill common form fields on generic job sites
+        Generic form values and checkboxes by field selector, read from the
+        environment once
         
-        Args:
-            driver (WebDriver): Selenium WebDriver
+        Returns:
+            dict: Values (str or True) by CSS selector
         """
         # Map common field names to environment variables
         fields_mapping = {
@@ -2539,21 +3510,6 @@ class JobApplicationAutomator:
             # Add more common field mappings as needed
         }
         
-        for selector, value in fields_mapping.items():
-            if not value:  # Skip empty values
-                continue
-                
-            try:
-                fields = driver.find_elements(By.CSS_SELECTOR, selector)
-                for field in fields:
-                    if field.is_displayed() and field.is_enabled():
-                        field.clear()
-                        field.send_keys(value)
-                        logger.info(f"Filled field with selector: {selector}")
-            except Exception:
-                # Ignore errors for individual fields
-                pass
-                
         # Handle checkboxes for terms, privacy policy, etc.
         checkbox_selectors = [
             "input[type='checkbox'][name*='agree' i]",
@@ -2563,17 +3519,18 @@ class JobApplicationAutomator:
             "input[type='checkbox'][name*='privacy' i]",
             "input[type='checkbox'][id*='privacy' i]"
         ]
+        fields_mapping.update(dict.fromkeys(checkbox_selectors, True))
+        return fields_mapping
+    
+    def _fill_generic_form_fields(self, driver):
+        """
+        Fill common form fields on generic job sites
         
-        for selector in checkbox_selectors:
-            try:
-                checkboxes = driver.find_elements(By.CSS_SELECTOR, selector)
-                for checkbox in checkboxes:
-                    if checkbox.is_displayed() and checkbox.is_enabled() and not checkbox.is_selected():
-                        checkbox.click()
-                        logger.info(f"Checked checkbox with selector: {selector}")
-            except Exception:
-                # Ignore errors for individual checkboxes
-                pass
+        Args:
+            driver (WebDriver): Selenium WebDriver
+        """
+        # Fill fields and check boxes in a single WebDriver command
+        self._bulk_fill(driver, self._generic_fields_mapping)
     
     def run(self, limit=None):
         """
@@ -2585,46 +3542,118 @@ class JobApplicationAutomator:
         Returns:
             int: Number of successfully submitted applications
         """
-        # Get pending applications
-        pending = self.get_pending_applications()
-        
-        if not pending:
-            logger.info("No pending applications to process")
-            return 0
-        
-        # Check daily limit
+        # Check daily limit before scanning for pending applications
         if self.check_daily_limit():
             logger.warning("Daily application limit reached. Try again tomorrow.")
             return 0
         
-        # Apply limit if specified
+        # Stream pending applications, stopping the scan once the limit is reached
+        pending = self.iter_pending_applications()
         if limit:
-            pending = pending[:limit]
+            pending = itertools.islice(pending, limit)
         
-        # Track successful submissions
+        # Submit applications on the shared worker pool
+        futures = {self._executor.submit(self._submit_pending_application, application): application for application in pending}
+        processed = len(futures)
         successful = 0
         
-        # Process applications
-        for application in pending:
+        for future in as_completed(futures):
             try:
-                # Submit application
-                if self.submit_application(application):
+                if future.result():
                     successful += 1
-                
-                # Add delay between applications
-                time.sleep(self.application_delay)
-                
-                # Check if daily limit reached
-                if self.check_daily_limit():
-                    logger.info("Daily application limit reached during processing")
-                    break
-                
             except Exception as e:
-                logger.error(f"Error processing application {application['dir']}: {str(e)}")
+                logger.error(f"Error processing application {futures[future]['dir']}: {str(e)}")
+        
+        if not processed:
+            logger.info("No pending applications to process")
+            return 0
+        
+        # Make the batch's history updates durable with a single sync
+        self._sync_log_dir()
+        self._close_all_browsers()
         
-        logger.info(f"Processed {len(pending)} applications, {successful} successfully submitted")
+        logger.info(f"Processed {processed} applications, {successful} successfully submitted")
         return successful
 
+    def _submit_pending_application(self, application):
+        """
+        Submit a pending application from a worker thread, respecting the
+        daily limit and the delay between submissions
+        
+        Args:
+            application (dict): Application details
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self.check_daily_limit():
+            logger.info("Daily application limit reached during processing")
+            return False
+        
+        self._wait_for_submission_slot()
+        return self.submit_application(application)
+    
+    def _wait_for_submission_slot(self):
+        """
+        Space submission starts at least application_delay seconds apart
+        across all worker threads
+        """
+        with self._submission_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_submission_at)
+            self._next_submission_at = start_at + self.application_delay
+        
+        if start_at > now:
+            time.sleep(start_at - now)
+    
+    def close(self):
+        """
+        Shut down the submission worker pool and close all browsers
+        """
+        self._executor.shutdown(wait=True)
+        self._compact_pending_applications()
+        self._flush_recovery()
+        self._close_all_browsers()
+    
+    def submit_applications_parallel(self, applications, workers=4):
+        """
+        Submit applications concurrently, each worker thread reusing its own
+        browser across the applications it handles
+        
+        Args:
+            applications (list): Pending applications, as returned by get_pending_applications
+            workers (int): Number of concurrent browsers
+            
+        Returns:
+            int: Number of successfully submitted applications
+        """
+        successful = 0
+        
+        # Threads of this pool, so only their browsers are closed afterwards
+        worker_ids = set()
+        
+        def submit(application):
+            worker_ids.add(threading.get_ident())
+            return self._submit_pending_application(application)
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="apply-parallel") as executor:
+            futures = {executor.submit(submit, application): application for application in applications}
+            
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        successful += 1
+                except Exception as e:
+                    logger.error(f"Error processing application {futures[future].get('dir')}: {str(e)}")
+        
+        # Workers are gone, so close the browsers they left open; browsers of
+        # other threads, such as the submission pool, stay open
+        self._close_browsers(worker_ids)
+        self._sync_log_dir()
+        
+        logger.info(f"Processed {len(futures)} applications in parallel, {successful} successfully submitted")
+        return successful
+    
     def job_meets_requirements(self, job):
         """
         Check if a job meets the requirements for applying
@@ -2641,50 +3670,45 @@ class JobApplicationAutomator:
             employer_name = job.get("employer_name", "").lower()
             job_description = job.get("job_description", "").lower()
             
-            # Load exclusion lists
-            excluded_companies = set(self.config.get("excluded_companies", []))
-            excluded_titles = set(self.config.get("excluded_titles", []))
-            excluded_terms = set(self.config.get("excluded_terms", []))
-            
             # Check if job title matches allowed patterns
             title_matches = False
-            for title_pattern in self.config.get("job_titles", []):
-                if title_pattern.lower() in job_title:
+            for title_pattern in self._job_titles_lc:
+                if title_pattern in job_title:
                     title_matches = True
                     break
             
             if not title_matches:
-                logger.info(f"Skipping job '{job_title}' - title doesn't match any allowed patterns")
+                logger.info("Skipping job '%s' - title doesn't match any allowed patterns", job_title)
                 return False
             
             # Check if this job is from an excluded company
-            for company in excluded_companies:
-                if company.lower() in employer_name:
-                    logger.info(f"Skipping job at '{employer_name}' - excluded company")
+            for company in self._excluded_companies_lc:
+                if company in employer_name:
+                    logger.info("Skipping job at '%s' - excluded company", employer_name)
                     return False
             
             # Check if this job title contains excluded terms
-            for term in excluded_titles:
-                if term.lower() in job_title:
-                    logger.info(f"Skipping job '{job_title}' - excluded title term")
+            for term in self._excluded_titles_lc:
+                if term in job_title:
+                    logger.info("Skipping job '%s' - excluded title term", job_title)
                     return False
             
             # Check if job description contains excluded terms
-            for term in excluded_terms:
-                if term.lower() in job_description:
-                    logger.info(f"Skipping job '{job_title}' - excluded term in description")
+            for term in self._excluded_terms_lc:
+                if term in job_description:
+                    logger.info("Skipping job '%s' - excluded term in description", job_title)
                     return False
             
             # Check if we've already applied to this job
             if self.has_applied_to_job(job):
-                logger.info(f"Skipping job '{job_title}' at '{employer_name}' - already applied")
+                logger.info("Skipping job '%s' at '%s' - already applied", job_title, employer_name)
                 return False
             
             # All checks passed
             return True
             
         except Exception as e:
-            logger.error(f"Error checking job requirements: {str(e)}")
+            logger.error("Error checking job requirements: %s", e)
             return False
     
     def prepare_application_package(self, job):
@@ -2697,9 +3721,55 @@ class JobApplicationAutomator:
         Returns:
             dict: Application package with all necessary materials
         """
+        application = self._build_application_package(job)
+        
+        if application:
+            # Add the application to pending applications
+            self.pending_applications.append(application)
+            
+            # Save the updated pending applications
+            self._save_pending_applications()
+        
+        return application
+    
+    def prepare_application_packages(self, jobs):
+        """
+        Prepare application packages for a batch of jobs in parallel
+        
+        Args:
+            jobs (list): Job details for each job to prepare
+            
+        Returns:
+            list: Application packages that were created
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        
+        # Package preparation is independent per job and dominated by file I/O
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            applications = [app for app in executor.map(self._build_application_package, jobs) if app]
+        
+        if applications:
+            self.pending_applications.extend(applications)
+            self._save_pending_applications()
+        
+        logger.info(f"Prepared {len(applications)} application packages from {len(jobs)} jobs")
+        return applications
+    
+    def _build_application_package(self, job):
+        """
+        Create the application directory and materials for a job
+        
+        Args:
+            job (dict): Job details
+            
+        Returns:
+            dict: Application package, or None if it already exists or failed
+        """
         try:
             # Extract job details
-            job_id = job.get("job_id", uuid.uuid4().hex)
+            job_id = job.get("job_id") or os.urandom(8).hex()
             job_title = job.get("job_title", "Unknown Position")
             employer_name = job.get("employer_name", "Unknown Company")
             job_location = job.get("job_location", "Unknown Location")
@@ -2712,20 +3782,19 @@ class JobApplicationAutomator:
             clean_job_title = self._clean_filename(job_title.lower())
             
             # Create a unique folder for this application
-            date_str = datetime.now().strftime("%Y%m%d")
+            date_str = _date_str("%Y%m%d")
             application_dir = os.path.join(
                 self.application_path,
                 f"{clean_company_name}_{date_str}_{clean_job_title}"
             )
             
-            # Skip if we've already created this application package
-            if os.path.exists(application_dir):
+            # Create the application directory, skipping packages that already exist
+            try:
+                os.makedirs(application_dir)
+            except FileExistsError:
                 logger.info(f"Application package already exists for {employer_name} - {job_title}")
                 return None
             
-            # Create the application directory
-            os.makedirs(application_dir, exist_ok=True)
-            
             # Analyze the job for required skills and keywords
             required_skills = job.get("job_required_skills", self._extract_skills(job_description))
             
@@ -2748,8 +3817,8 @@ class JobApplicationAutomator:
             
             # Save job details to JSON
             job_details_path = os.path.join(application_dir, "job_details.json")
-            with open(job_details_path, "w") as f:
-                json.dump(job, f, indent=4)
+            with open(job_details_path, "wb") as f:
+                f.write(_json_dumps(job, pretty=self.debug))
             
             # Create application record
             application = {
@@ -2768,19 +3837,16 @@ class JobApplicationAutomator:
                 "required_skills": required_skills
             }
             
-            # Add the application to pending applications
-            self._pending_applications.append(application)
-            
-            # Save the updated pending applications
-            self._save_pending_applications()
-            
+            logger.info(f"Prepared application package for {employer_name} - {job_title}")
             return application
             
         except Exception as e:
             logger.error(f"Error preparing application package: {str(e)}")
             return None
             
-    def _clean_filename(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _clean_filename(name):
         """
         Clean a string to be used as a filename
         
@@ -2791,9 +3857,9 @@ class JobApplicationAutomator:
             str: Cleaned string safe for filenames
         """
         # Replace spaces and special characters
-        cleaned = re.sub(r'[^\w\s-]', '', name)
-        cleaned = re.sub(r'[\s]+', '_', cleaned)
-        cleaned = re.sub(r'[-]+', '-', cleaned)
+        cleaned = _FILENAME_INVALID_RE.sub('', name)
+        cleaned = _FILENAME_SPACES_RE.sub('_', cleaned)
+        cleaned = _FILENAME_DASHES_RE.sub('-', cleaned)
         return cleaned
         
     def _extract_skills(self, text):
@@ -2832,28 +3898,6 @@ class JobApplicationAutomator:
             str: Path to the cover letter file
         """
         try:
-            # Load cover letter template
-            template_path = os.path.join(os.path.dirname(__file__), "templates", "cover_letter_template.txt")
-            
-            if not os.path.exists(template_path):
-                logger.warning(f"Cover letter template not found at {template_path}, using default template")
-                template = """Dear Hiring Manager,
-
-I am writing to express my interest in the {job_title} position at {company_name}. With my experience in {skills}, I believe I would be a valuable addition to your team.
-
-{custom_paragraph}
-
-Thank you for considering my application. I look forward to the opportunity to discuss how my skills and experience align with your needs.
-
-Sincerely,
-{name}
-{email}
-{phone}
-"""
-            else:
-                with open(template_path, "r") as f:
-                    template = f.read()
-            
             # Create custom paragraph based on job description and skills
             skills_text = ", ".join(skills[:5])  # Limit to top 5 skills
             
@@ -2861,14 +3905,12 @@ Sincerely,
                               f"Throughout my career, I've developed expertise in these areas through hands-on experience and continuous learning."
             
             # Fill in the template
-            cover_letter = template.format(
+            cover_letter = self._cover_letter_template.format(
                 job_title=job_title,
                 company_name=company_name,
                 skills=skills_text,
                 custom_paragraph=custom_paragraph,
-                name=self.config.get("name", "Your Name"),
-                email=self.config.get("email", "your.email@example.com"),
-                phone=self.config.get("phone", "123-456-7890")
+                **self._letter_contact
             )
             
             # Save the cover letter
@@ -2902,9 +3944,18 @@ Sincerely,
             resume_filename = os.path.basename(self.resume_path)
             tailored_resume_path = os.path.join(application_dir, resume_filename)
             
-            # Copy the resume to the application directory
-            shutil.copy2(self.resume_path, tailored_resume_path)
-            
+            # Nothing to do if the destination already is the source file
+            if os.path.exists(tailored_resume_path) and os.path.samefile(self.resume_path, tailored_resume_path):
+                return tailored_resume_path
+
+            # Hardlink the resume into the application directory when on the
+            # same filesystem, otherwise fall back to a plain data copy
+            try:
+                os.link(self.resume_path, tailored_resume_path)
+            except OSError:
+                import shutil
+                shutil.copyfile(self.resume_path, tailored_resume_path)
+
             return tailored_resume_path
             
         except Exception as e:
@@ -2926,12 +3977,8 @@ Sincerely,
         else:
             logger.info(f"Processing up to {limit} pending applications")
         
-        # Load pending applications if needed
-        if not self._pending_applications:
-            self._load_pending_applications()
-            
         # Get pending applications
-        pending = [app for app in self._pending_applications if app.get("status") == "pending"]
+        pending = [app for app in self.pending_applications if app.get("status") == "pending"]
         logger.info(f"Found {len(pending)} pending applications")
         
         if not pending:
@@ -2941,43 +3988,69 @@ Sincerely,
         processed_count = 0
         successful_count = 0
         
-        for application in pending[:limit]:
+        # Submit on the shared worker pool; status updates stay on this thread
+        futures = [self._executor.submit(self._submit_one, application) for application in pending[:limit]]
+        
+        for future in as_completed(futures):
             try:
-                logger.info(f"Attempting to submit application for: {application.get('job_title')} at {application.get('employer_name')}")
-                
-                # Create an application dict that matches the format expected by submit_application
-                app_submission = {
-                    "metadata": {
-                        "job_title": application.get("job_title"),
-                        "company": application.get("employer_name"),
-                        "apply_link": application.get("job_apply_link")
-                    },
-                    "path": application.get("application_dir"),
-                    "dir": os.path.basename(application.get("application_dir"))
-                }
-                
-                # Submit the application
-                result = self.submit_application(app_submission)
+                application, result = future.result()
                 
                 processed_count += 1
                 
                 if result:
                     successful_count += 1
                     # Update application status
-                    application["status"] = "submitted"
-                    application["application_date"] = datetime.now().isoformat()
-                    # Save updated pending applications
-                    self._save_pending_applications()
-                    logger.info(f"Successfully submitted application for {application.get('job_title')} at {application.get('employer_name')}")
+                    update = {"status": "submitted", "application_date": datetime.now().isoformat()}
+                    application.update(update)
+                    # Journal the status change instead of rewriting the whole file
+                    self._append_pending_journal({"op": "update", "job_id": application.get("job_id"), **update})
+                    logger.info("Successfully submitted application for %s at %s", application.get('job_title'), application.get('employer_name'))
                 else:
-                    logger.error(f"Failed to submit application for {application.get('job_title')} at {application.get('employer_name')}")
+                    logger.error("Failed to submit application for %s at %s", application.get('job_title'), application.get('employer_name'))
+                
+                # Sync the journal periodically so a crash loses at most a few updates
+                if processed_count % PENDING_JOURNAL_SYNC_EVERY == 0:
+                    self._flush_pending_journal()
                     
             except Exception as e:
                 logger.error(f"Error processing application: {str(e)}")
+        
+        # Make the batch's journal and history updates durable with a single sync
+        self._flush_pending_journal()
+        if self._pending_journal_entries >= self.pending_journal_max_entries:
+            self._compact_pending_applications()
+        self._sync_log_dir()
+        self._close_all_browsers()
                 
         logger.info(f"Processed {processed_count} applications, {successful_count} successfully submitted")
         return successful_count
     
+    def _submit_one(self, application):
+        """
+        Submit a pending application from process_applications on a worker thread
+        
+        Args:
+            application (dict): Pending application entry
+            
+        Returns:
+            tuple: The application and whether it was submitted successfully
+        """
+        logger.info(f"Attempting to submit application for: {application.get('job_title')} at {application.get('employer_name')}")
+        
+        # Create an application dict that matches the format expected by submit_application
+        app_submission = {
+            "job_id": application.get("job_id"),
+            "metadata": {
+                "job_title": application.get("job_title"),
+                "company": application.get("employer_name"),
+                "apply_link": application.get("job_apply_link")
+            },
+            "path": application.get("application_dir"),
+            "dir": os.path.basename(application.get("application_dir"))
+        }
+        
+        return application, self.submit_application(app_submission)
+    
     def get_recent_applications(self, count=5, status=None):
         """
         Get recent applications
@@ -2990,52 +4063,134 @@ Sincerely,
             list: Recent applications
         """
         # Load application history
-        if not self._application_history:
+        if self._application_history is None:
             self._load_application_history()
             
-        # Sort by application date (newest first)
-        sorted_applications = sorted(
-            self._application_history,
-            key=lambda x: x.get("application_date", ""),
-            reverse=True
-        )
+        # History is kept oldest first, so walk it backwards (newest first)
+        recent = reversed(self._application_history)
         
         # Filter by status if provided
         if status:
-            filtered = [app for app in sorted_applications if app.get("status") == status]
-        else:
-            filtered = sorted_applications
+            recent = (record for record in recent if record.status == status)
             
         # Return the most recent ones
-        return filtered[:count]
+        return [record.to_dict() for record in itertools.islice(recent, count)]
 
     def _load_pending_applications(self):
         """
         Load pending applications from file
         """
-        pending_file = os.path.join(self.log_dir, "pending_applications.json")
-        
-        if os.path.exists(pending_file):
-            try:
-                with open(pending_file, 'r') as f:
-                    self._pending_applications = json.load(f)
-                logger.info(f"Loaded {len(self._pending_applications)} pending applications")
-            except Exception as e:
-                logger.error(f"Error loading pending applications: {str(e)}")
-                self._pending_applications = []
-        else:
+        try:
+            with open(self.pending_file_path, 'rb') as f:
+                applications = _json_loads(f.read())
+            
+            # Drop duplicate entries, keeping the newest one for each job
+            unique = {}
+            for app in applications:
+                unique[app.get("job_id") or (app.get("job_title"), app.get("employer_name"))] = app
+            self._pending_applications = list(unique.values())
+            
+            if len(unique) < len(applications):
+                logger.warning(f"Dropped {len(applications) - len(unique)} duplicate pending applications")
+            logger.info(f"Loaded {len(self._pending_applications)} pending applications")
+        except FileNotFoundError:
+            self._pending_applications = []
+        except Exception as e:
+            logger.error(f"Error loading pending applications: {str(e)}")
             self._pending_applications = []
+        
+        self._replay_pending_journal()
+    
+    def _replay_pending_journal(self):
+        """
+        Apply journaled status changes on top of the loaded pending applications
+        """
+        self._pending_journal_entries = 0
+        by_job_id = {app.get("job_id"): app for app in self._pending_applications}
+        
+        try:
+            with open(self._pending_journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = _json_loads(line)
+                    except ValueError:
+                        # A crash can leave a partially written last line
+                        logger.warning("Skipping unreadable pending journal entry")
+                        continue
+                    
+                    self._pending_journal_entries += 1
+                    application = by_job_id.get(entry.get("job_id"))
+                    if application is not None and entry.get("op") == "update":
+                        application["status"] = entry.get("status")
+                        application["application_date"] = entry.get("application_date")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Error replaying pending applications journal: {str(e)}")
+            return
+        
+        logger.info(f"Replayed {self._pending_journal_entries} pending application journal entries")
+    
+    def _append_pending_journal(self, entry):
+        """
+        Append a single status change to the pending applications journal
+        
+        Args:
+            entry (dict): Journal entry with op, job_id and the changed fields
+        """
+        try:
+            with self._pending_journal_lock:
+                if self._pending_journal is None:
+                    # Unbuffered so every entry reaches the file as one complete write
+                    self._pending_journal = open(self._pending_journal_file, 'ab', buffering=0)
+                self._pending_journal.write(_json_dumps(entry))
+                self._pending_journal_entries += 1
+        except Exception as e:
+            logger.error(f"Error writing pending applications journal: {str(e)}")
+    
+    def _flush_pending_journal(self):
+        """
+        Make appended journal entries durable on disk
+        """
+        if self._pending_journal is None:
+            return
+        
+        try:
+            os.fsync(self._pending_journal.fileno())
+        except OSError as e:
+            logger.error(f"Error syncing pending applications journal: {str(e)}")
+    
+    def _compact_pending_applications(self):
+        """
+        Fold the journal into pending_applications.json and start a new journal
+        """
+        if self._pending_journal_entries:
+            self._save_pending_applications()
+    
+    def _reset_pending_journal(self):
+        """
+        Discard the journal once its changes are part of pending_applications.json
+        """
+        if self._pending_journal is not None:
+            self._pending_journal.close()
+            self._pending_journal = None
+        
+        try:
+            os.remove(self._pending_journal_file)
+        except FileNotFoundError:
+            pass
+        self._pending_journal_entries = 0
     
     def _save_pending_applications(self):
         """
         Save pending applications to file
         """
-        pending_file = os.path.join(self.log_dir, "pending_applications.json")
-        
         try:
-            with open(pending_file, 'w') as f:
-                json.dump(self._pending_applications, f, indent=2)
+            self._atomic_write_json(self.pending_file_path, self._pending_applications)
             logger.info(f"Saved {len(self._pending_applications)} pending applications")
+            
+            # The saved file already contains every journaled change
+            self._reset_pending_journal()
         except Exception as e:
             logger.error(f"Error saving pending applications: {str(e)}")
     
@@ -3049,46 +4204,49 @@ Sincerely,
         Returns:
             bool: True if already applied, False otherwise
         """
-        # Load application history if needed
-        if self._application_history is None:
-            self._load_application_history()
+        # Accessing the history builds the lookup indexes on first use; the
+        # archive is only read once a duplicate check actually needs it
+        self.application_history
+        self._index_archived_applications()
         
         job_id = job.get('job_id')
-        job_title = job.get('job_title', '').lower()
-        employer_name = job.get('employer_name', '').lower()
-        
-        # Check applications by ID if available
         if job_id:
-            for app in self._application_history:
-                if app.get('job_id') == job_id:
-                    return True
+            cached = self._applied_cache.get(job_id)
+            if cached is not None:
+                return cached
         
-        # Check applications by title and employer
-        for app in self._application_history:
-            app_title = (app.get('job_title') or '').lower()
-            app_employer = (app.get('employer_name') or '').lower()
-            
-            if app_title and app_employer and app_title in job_title and app_employer in employer_name:
-                return True
+        key = self._application_key(job.get('employer_name'), job.get('job_title'))
+        applied = job_id in self._applied_ids or (key is not None and key in self._applied_keys)
         
-        return False
+        if job_id:
+            self._applied_cache[job_id] = applied
+        return applied
     
     def _load_application_history(self):
         """
-        Load application history
+        Load the most recent application history entries, streaming the
+        history file line by line
         """
-        if not os.path.exists(self.application_history_file):
-            self._application_history = []
-            return
-            
+        self._migrate_legacy_history()
+        
         try:
-            with open(self.application_history_file, 'r') as f:
-                history = json.load(f)
-                self._application_history = history.get('applications', [])
+            # Keep only the summary fields of the newest entries
+            recent = deque(
+                (ApplicationRecord.from_dict(app) for app in self._iter_history_file()),
+                maxlen=RECENT_HISTORY_LIMIT
+            )
+            
+            # Order by application date once so get_recent_applications never sorts
+            self._application_history = deque(
+                sorted(recent, key=lambda record: record.application_date),
+                maxlen=RECENT_HISTORY_LIMIT
+            )
             logger.info(f"Loaded {len(self._application_history)} application history entries")
+        except FileNotFoundError:
+            self._application_history = deque(maxlen=RECENT_HISTORY_LIMIT)
         except Exception as e:
             logger.error(f"Error loading application history: {str(e)}")
-            self._application_history = []
+            self._application_history = deque(maxlen=RECENT_HISTORY_LIMIT)
     
     def _smart_field_detection(self, driver):
         """
@@ -3109,8 +4267,7 @@ Sincerely,
             
             return stats
         except Exception as e:
-            logger.error(f"Error in smart field detection: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error in smart field detection: {str(e)}")
             return {
                 'processed': 0,
                 'filled': 0,
@@ -3499,8 +4656,8 @@ Sincerely,
         profile_path = os.getenv("USER_PROFILE_PATH", "user_profile.json")
         if os.path.exists(profile_path):
             try:
-                with open(profile_path, 'r') as f:
-                    detailed_profile = json.load(f)
+                with open(profile_path, 'rb') as f:
+                    detailed_profile = _json_loads(f.read())
                     # Merge with existing profile, with detailed profile taking precedence
                     profile = {**profile, **detailed_profile}
                     logger.info(f"Loaded detailed profile from {profile_path}")